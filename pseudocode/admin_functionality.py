@@ -16,16 +16,32 @@ TDD Test Cases:
 """
 
 import os
+import asyncio
 import logging
 import datetime
+import functools
+import random
+import time
+from collections import OrderedDict
 from enum import Enum
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Sequence, Tuple
 from dataclasses import dataclass
-import uuid
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched prompt is reused, jittered by up to 20% either way so
+# entries cached together do not all expire together
+_PROMPT_TTL = 60.0
+_PROMPT_TTL_JITTER = 0.2
+
+# Maximum number of prompts kept in each in-process cache
+_PROMPT_CACHE_SIZE = 256
+
+# Seconds between requests to refresh the conversation_metrics_daily view;
+# matches the age at which request_conversation_metrics_refresh refreshes it
+_METRICS_REFRESH_INTERVAL = 300.0
+
 # System prompt category
 class PromptCategory(Enum):
     GENERAL = "general"
@@ -35,14 +51,22 @@ class PromptCategory(Enum):
     EDUCATIONAL = "educational"
     CUSTOM = "custom"
 
+# Enum members by stored value, so rows don't call the Enum constructor
+_CATEGORY_BY_VALUE = {category.value: category for category in PromptCategory}
+
 # User status
 class UserStatus(Enum):
     ACTIVE = "active"
     DISABLED = "disabled"
     PENDING = "pending"
 
+_STATUS_BY_VALUE = {status.value: status for status in UserStatus}
+
+# Supabase Auth ban length for disabled users (about 100 years); "none" lifts it
+_DISABLED_BAN_DURATION = "876000h"
+
 # System prompt
-@dataclass
+@dataclass(slots=True)
 class SystemPrompt:
     id: str
     created_by: str
@@ -54,7 +78,7 @@ class SystemPrompt:
     updated_at: datetime.datetime
 
 # User summary
-@dataclass
+@dataclass(slots=True)
 class UserSummary:
     id: str
     email: str
@@ -72,8 +96,17 @@ class MetricsPeriod(Enum):
     YEAR = "year"
     ALL = "all"
 
+# Length of each bounded metrics period; ALL starts at _METRICS_EPOCH
+_PERIOD_DELTAS = {
+    MetricsPeriod.DAY: datetime.timedelta(days=1),
+    MetricsPeriod.WEEK: datetime.timedelta(weeks=1),
+    MetricsPeriod.MONTH: datetime.timedelta(days=30),
+    MetricsPeriod.YEAR: datetime.timedelta(days=365)
+}
+_METRICS_EPOCH = datetime.datetime(2000, 1, 1)  # Far in the past
+
 # Conversation metrics
-@dataclass
+@dataclass(slots=True)
 class ConversationMetrics:
     total_conversations: int
     active_users: int
@@ -84,14 +117,73 @@ class ConversationMetrics:
     start_date: datetime.datetime
     end_date: datetime.datetime
 
+# Position after the last listed user: (created_at, id)
+UserCursor = Tuple[datetime.datetime, str]
+
 # Pagination result
 @dataclass
 class PaginatedResult:
     items: List[Any]
-    total: int
-    page: int
+    total: Optional[int]  # None when the total was not requested
+    page: Optional[int]  # None for cursor-paginated results
     page_size: int
     has_more: bool
+    next_cursor: Optional[UserCursor] = None
+
+@functools.lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime.datetime:
+    """
+    Parse an ISO 8601 timestamp, caching results since admin lists often
+    repeat the same created_at and updated_at values
+    
+    Args:
+        value: ISO 8601 timestamp string
+        
+    Returns:
+        Parsed datetime
+    """
+    return datetime.datetime.fromisoformat(value)
+
+def _prompt_from_row(prompt_data: Dict[str, Any]) -> SystemPrompt:
+    """
+    Build a SystemPrompt from a system_prompts table row
+    
+    Args:
+        prompt_data: Row returned by Supabase
+        
+    Returns:
+        SystemPrompt object
+    """
+    return SystemPrompt(
+        id=prompt_data["id"],
+        created_by=prompt_data["created_by"],
+        name=prompt_data["name"],
+        content=prompt_data["content"],
+        category=_CATEGORY_BY_VALUE[prompt_data["category"]],
+        is_default=prompt_data["is_default"],
+        created_at=_parse_iso(prompt_data["created_at"]),
+        updated_at=_parse_iso(prompt_data["updated_at"])
+    )
+
+def _user_summary_from_row(user_data: Dict[str, Any]) -> UserSummary:
+    """
+    Build a UserSummary from a get_user_summaries row
+    
+    Args:
+        user_data: Row returned by Supabase
+        
+    Returns:
+        UserSummary object
+    """
+    return UserSummary(
+        id=user_data["id"],
+        email=user_data["email"],
+        full_name=user_data["full_name"],
+        role=user_data["role"],
+        status=_STATUS_BY_VALUE[user_data["status"]],
+        created_at=_parse_iso(user_data["created_at"]),
+        conversation_count=user_data["conversation_count"]
+    )
 
 class AdminService:
     def __init__(self, supabase_client, auth_service):
@@ -99,11 +191,27 @@ class AdminService:
         Initialize the admin service
         
         Args:
-            supabase_client: Initialized Supabase client
+            supabase_client: Initialized async Supabase client (from create_async_client)
             auth_service: Authentication service for permission checks
         """
         self.supabase = supabase_client
         self.auth = auth_service
+        
+        # Prompts by id and default prompts by category, each entry stamped
+        # with its expiry on the time.monotonic() clock
+        self._prompt_cache: OrderedDict[str, Tuple[float, SystemPrompt]] = OrderedDict()
+        self._default_cache: OrderedDict[PromptCategory, Tuple[float, SystemPrompt]] = OrderedDict()
+        
+        # time.monotonic() of the last conversation metrics refresh request
+        self._metrics_refresh_requested: Optional[float] = None
+        
+        # Prompt IDs requested in the current event loop tick, loaded together
+        # by one get_system_prompts call
+        self._prompt_batch: Dict[str, asyncio.Future] = {}
+        self._prompt_batch_task: Optional[asyncio.Task] = None
+        
+        # Fire-and-forget tasks, referenced until done so they aren't collected
+        self._background_tasks = set()
     
     async def create_system_prompt(
         self, 
@@ -132,17 +240,17 @@ class AdminService:
                 logger.error("Permission denied: User is not an admin")
                 return None
                 
-            # Create prompt in database
+            # Create prompt in database; the id is generated by the database
+            # and a new default unsets the category's old one in the same statement
             prompt_data = {
-                "id": str(uuid.uuid4()),
-                "created_by": admin_id,
-                "name": name,
-                "content": content,
-                "category": category.value,
-                "is_default": is_default
+                "p_created_by": admin_id,
+                "p_name": name,
+                "p_content": content,
+                "p_category": category.value,
+                "p_is_default": is_default
             }
             
-            response = self.supabase.table("system_prompts").insert(prompt_data).execute()
+            response = await self.supabase.rpc("create_system_prompt", prompt_data).execute()
             
             if not response.data:
                 logger.error("Failed to create system prompt")
@@ -151,28 +259,17 @@ class AdminService:
             # Get the created prompt
             prompt = response.data[0]
             
-            # If this is a default prompt, unset other defaults in the same category
-            if is_default:
-                self.supabase.table("system_prompts").update(
-                    {"is_default": False}
-                ).neq("id", prompt["id"]).eq("category", category.value).execute()
-            
             # Create prompt object
-            result = SystemPrompt(
-                id=prompt["id"],
-                created_by=prompt["created_by"],
-                name=prompt["name"],
-                content=prompt["content"],
-                category=PromptCategory(prompt["category"]),
-                is_default=prompt["is_default"],
-                created_at=datetime.datetime.fromisoformat(prompt["created_at"]),
-                updated_at=datetime.datetime.fromisoformat(prompt["updated_at"])
-            )
+            result = _prompt_from_row(prompt)
+            
+            # A new default replaces the category's cached one
+            if is_default:
+                self._invalidate_prompt(result.id, category)
             
             return result
             
         except Exception as e:
-            logger.error(f"Create system prompt error: {str(e)}")
+            logger.error("Create system prompt error: %s", e)
             return None
     
     async def update_system_prompt(
@@ -208,53 +305,42 @@ class AdminService:
             update_data = {}
             
             if name is not None:
-                update_data["name"] = name
+                update_data["p_name"] = name
                 
             if content is not None:
-                update_data["content"] = content
+                update_data["p_content"] = content
                 
             if category is not None:
-                update_data["category"] = category.value
+                update_data["p_category"] = category.value
                 
             if is_default is not None:
-                update_data["is_default"] = is_default
+                update_data["p_is_default"] = is_default
                 
             if not update_data:
                 # Nothing to update, get current prompt
                 return await self.get_system_prompt(prompt_id)
                 
-            # Update prompt in database
-            response = self.supabase.table("system_prompts").update(update_data).eq("id", prompt_id).execute()
+            # Update prompt in database; a new default unsets the other
+            # defaults of its category in the same transaction
+            response = await self.supabase.rpc(
+                "update_system_prompt", {"p_prompt_id": prompt_id, **update_data}
+            ).execute()
             
-            if not response.data:
-                logger.error(f"Failed to update system prompt: {prompt_id}")
+            prompt = response.data[0] if response.data else None
+            
+            if not prompt:
+                self._invalidate_prompt(prompt_id)
+                logger.error("Failed to update system prompt: %s", prompt_id)
                 return None
                 
-            # Get the updated prompt
-            prompt = response.data[0]
-            
-            # If this is now a default prompt, unset other defaults in the same category
-            if is_default:
-                self.supabase.table("system_prompts").update(
-                    {"is_default": False}
-                ).neq("id", prompt_id).eq("category", prompt["category"]).execute()
-            
             # Create prompt object
-            result = SystemPrompt(
-                id=prompt["id"],
-                created_by=prompt["created_by"],
-                name=prompt["name"],
-                content=prompt["content"],
-                category=PromptCategory(prompt["category"]),
-                is_default=prompt["is_default"],
-                created_at=datetime.datetime.fromisoformat(prompt["created_at"]),
-                updated_at=datetime.datetime.fromisoformat(prompt["updated_at"])
-            )
+            result = _prompt_from_row(prompt)
+            self._invalidate_prompt(prompt_id, result.category if result.is_default else None)
             
             return result
             
         except Exception as e:
-            logger.error(f"Update system prompt error: {str(e)}")
+            logger.error("Update system prompt error: %s", e)
             return None
     
     async def delete_system_prompt(self, prompt_id: str) -> bool:
@@ -273,20 +359,21 @@ class AdminService:
                 logger.error("Permission denied: User is not an admin")
                 return False
                 
-            # Check if prompt is in use
-            conversations_response = self.supabase.table("conversations").select("id").eq("system_prompt_id", prompt_id).limit(1).execute()
+            # Delete prompt from database unless a conversation uses it; the
+            # check and the delete are one statement
+            response = await self.supabase.rpc(
+                "delete_system_prompt_if_unused", {"p_prompt_id": prompt_id}
+            ).execute()
             
-            if conversations_response.data:
-                logger.error(f"Cannot delete prompt {prompt_id}: In use by conversations")
+            if not response.data:
+                logger.error("Cannot delete prompt %s: Not found or in use by conversations", prompt_id)
                 return False
                 
-            # Delete prompt from database
-            response = self.supabase.table("system_prompts").delete().eq("id", prompt_id).execute()
-            
-            return bool(response.data)
+            self._invalidate_prompt(prompt_id)
+            return True
             
         except Exception as e:
-            logger.error(f"Delete system prompt error: {str(e)}")
+            logger.error("Delete system prompt error: %s", e)
             return False
     
     async def get_system_prompt(self, prompt_id: str) -> Optional[SystemPrompt]:
@@ -299,33 +386,104 @@ class AdminService:
         Returns:
             System prompt or None if not found
         """
+        cached = self._cache_get(self._prompt_cache, prompt_id)
+        if cached:
+            return cached
+            
+        # Join the batch for this tick, starting one if none is pending
+        future = self._prompt_batch.get(prompt_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._prompt_batch:
+                self._prompt_batch_task = loop.create_task(self._load_prompt_batch())
+            future = loop.create_future()
+            self._prompt_batch[prompt_id] = future
+            
+        # Shielded so one cancelled caller does not cancel the others
         try:
-            # Get prompt from database
-            response = self.supabase.table("system_prompts").select("*").eq("id", prompt_id).single().execute()
+            result = await asyncio.shield(future)
+        except Exception as e:
+            logger.error("Get system prompt error: %s", e)
+            return None
+        
+        if not result:
+            logger.error("System prompt not found: %s", prompt_id)
+        return result
+    
+    async def get_system_prompts(self, ids: Sequence[str]) -> Dict[str, SystemPrompt]:
+        """
+        Get several system prompts with a single query
+        
+        Args:
+            ids: IDs of the prompts to fetch
             
-            if not response.data:
-                logger.error(f"System prompt not found: {prompt_id}")
-                return None
+        Returns:
+            Dictionary mapping prompt ID to SystemPrompt for every prompt found
+        """
+        result = {}
+        missing = []
+        for prompt_id in ids:
+            cached = self._cache_get(self._prompt_cache, prompt_id)
+            if cached:
+                result[prompt_id] = cached
+            else:
+                missing.append(prompt_id)
                 
-            prompt = response.data
+        if not missing:
+            return result
             
-            # Create prompt object
-            result = SystemPrompt(
-                id=prompt["id"],
-                created_by=prompt["created_by"],
-                name=prompt["name"],
-                content=prompt["content"],
-                category=PromptCategory(prompt["category"]),
-                is_default=prompt["is_default"],
-                created_at=datetime.datetime.fromisoformat(prompt["created_at"]),
-                updated_at=datetime.datetime.fromisoformat(prompt["updated_at"])
-            )
+        try:
+            result.update(await self._fetch_system_prompts(missing))
+        except Exception as e:
+            logger.error("Get system prompts error: %s", e)
             
-            return result
+        return result
+    
+    async def _fetch_system_prompts(self, ids: Sequence[str]) -> Dict[str, SystemPrompt]:
+        """
+        Load system prompts from the database and cache them
+        
+        Args:
+            ids: IDs of the prompts to fetch
             
+        Returns:
+            Dictionary mapping prompt ID to SystemPrompt for every prompt found
+        """
+        response = await self.supabase.table("system_prompts").select("*").in_("id", ids).execute()
+        
+        result = {}
+        for prompt_data in response.data:
+            prompt = _prompt_from_row(prompt_data)
+            self._cache_put(self._prompt_cache, prompt.id, prompt)
+            result[prompt.id] = prompt
+        return result
+    
+    async def _load_prompt_batch(self) -> None:
+        """
+        Load every prompt requested through get_system_prompt in the current
+        tick with one query and resolve the waiting callers
+        
+        A failed or cancelled load resolves the callers with an exception,
+        so a database error is not reported as a missing prompt
+        """
+        batch, self._prompt_batch = self._prompt_batch, {}
+        prompts: Dict[str, SystemPrompt] = {}
+        error: Optional[BaseException] = None
+        try:
+            prompts = await self._fetch_system_prompts(list(batch))
         except Exception as e:
-            logger.error(f"Get system prompt error: {str(e)}")
-            return None
+            error = e
+        except BaseException:
+            error = RuntimeError("System prompt batch load was cancelled")
+            raise
+        finally:
+            for prompt_id, future in batch.items():
+                if future.done():
+                    continue
+                if error is None:
+                    future.set_result(prompts.get(prompt_id))
+                else:
+                    future.set_exception(error)
     
     async def list_system_prompts(
         self, 
@@ -348,32 +506,19 @@ class AdminService:
             # Calculate offset
             offset = (page - 1) * page_size
             
-            # Build query
-            query = self.supabase.table("system_prompts").select("*", count="exact")
+            # Get the page; every row also carries the total row count
+            response = await self.supabase.rpc(
+                "list_system_prompts_paged",
+                {
+                    "category_param": category.value if category else None,
+                    "limit_param": page_size,
+                    "offset_param": offset
+                }
+            ).execute()
             
-            if category:
-                query = query.eq("category", category.value)
-                
-            # Get total count
-            count_response = query.execute()
-            total = count_response.count
-            
-            # Get paginated results
-            response = query.order("name").range(offset, offset + page_size - 1).execute()
-            
-            prompts = []
-            for prompt_data in response.data:
-                prompt = SystemPrompt(
-                    id=prompt_data["id"],
-                    created_by=prompt_data["created_by"],
-                    name=prompt_data["name"],
-                    content=prompt_data["content"],
-                    category=PromptCategory(prompt_data["category"]),
-                    is_default=prompt_data["is_default"],
-                    created_at=datetime.datetime.fromisoformat(prompt_data["created_at"]),
-                    updated_at=datetime.datetime.fromisoformat(prompt_data["updated_at"])
-                )
-                prompts.append(prompt)
+            total = response.data[0]["total"] if response.data else 0
+            
+            prompts = [_prompt_from_row(prompt_data) for prompt_data in response.data]
             
             # Create paginated result
             result = PaginatedResult(
@@ -387,7 +532,7 @@ class AdminService:
             return result
             
         except Exception as e:
-            logger.error(f"List system prompts error: {str(e)}")
+            logger.error("List system prompts error: %s", e)
             return PaginatedResult([], 0, page, page_size, False)
     
     async def get_default_prompt(self, category: PromptCategory) -> Optional[SystemPrompt]:
@@ -400,32 +545,30 @@ class AdminService:
         Returns:
             Default system prompt or None if not found
         """
+        cached = self._cache_get(self._default_cache, category)
+        if cached:
+            return cached
+            
+        category_value = category.value
         try:
             # Get default prompt from database
-            response = self.supabase.table("system_prompts").select("*").eq("category", category.value).eq("is_default", True).single().execute()
+            response = await self.supabase.table("system_prompts").select("*").eq("category", category_value).eq("is_default", True).limit(1).maybe_single().execute()
             
-            if not response.data:
-                logger.error(f"No default prompt found for category: {category.value}")
+            # maybe_single() yields no response or empty data when the row is missing
+            if not response or not response.data:
+                logger.error("No default prompt found for category: %s", category_value)
                 return None
                 
             prompt = response.data
             
             # Create prompt object
-            result = SystemPrompt(
-                id=prompt["id"],
-                created_by=prompt["created_by"],
-                name=prompt["name"],
-                content=prompt["content"],
-                category=PromptCategory(prompt["category"]),
-                is_default=prompt["is_default"],
-                created_at=datetime.datetime.fromisoformat(prompt["created_at"]),
-                updated_at=datetime.datetime.fromisoformat(prompt["updated_at"])
-            )
+            result = _prompt_from_row(prompt)
+            self._cache_put(self._default_cache, category, result)
             
             return result
             
         except Exception as e:
-            logger.error(f"Get default prompt error: {str(e)}")
+            logger.error("Get default prompt error: %s", e)
             return None
     
     async def set_default_prompt(self, prompt_id: str) -> bool:
@@ -444,110 +587,96 @@ class AdminService:
                 logger.error("Permission denied: User is not an admin")
                 return False
                 
-            # Get prompt to get its category
-            prompt_response = self.supabase.table("system_prompts").select("category").eq("id", prompt_id).single().execute()
+            # Move the category's default to this prompt in one statement
+            response = await self.supabase.rpc(
+                "set_default_prompt", {"p_prompt_id": prompt_id}
+            ).execute()
             
-            if not prompt_response.data:
-                logger.error(f"System prompt not found: {prompt_id}")
+            if not response.data:
+                logger.error("System prompt not found: %s", prompt_id)
                 return False
                 
-            category = prompt_response.data["category"]
-            
-            # Unset other defaults in the same category
-            self.supabase.table("system_prompts").update(
-                {"is_default": False}
-            ).eq("category", category).execute()
-            
-            # Set this prompt as default
-            response = self.supabase.table("system_prompts").update(
-                {"is_default": True}
-            ).eq("id", prompt_id).execute()
-            
-            return bool(response.data)
+            self._invalidate_prompt(prompt_id, _CATEGORY_BY_VALUE[response.data[0]["category"]])
+            return True
             
         except Exception as e:
-            logger.error(f"Set default prompt error: {str(e)}")
+            logger.error("Set default prompt error: %s", e)
             return False
     
     async def list_users(
         self, 
-        page: int = 1, 
         page_size: int = 10,
-        status: Optional[UserStatus] = None
+        status: Optional[UserStatus] = None,
+        cursor: Optional[UserCursor] = None,
+        include_total: bool = False
     ) -> PaginatedResult:
         """
-        List users with pagination
+        List users, newest first, with keyset pagination
         
         Args:
-            page: Page number (1-based)
             page_size: Number of items per page
             status: Optional status to filter by
+            cursor: next_cursor of the previous page (None for the first page)
+            include_total: Whether to also estimate the number of users; the
+                estimate covers all users, so no total is returned when
+                status is set
             
         Returns:
-            Paginated result with user summaries
+            Paginated result with user summaries and the cursor of the next page
         """
         try:
             # Check admin permissions
             if not self.auth.is_admin():
                 logger.error("Permission denied: User is not an admin")
-                return PaginatedResult([], 0, page, page_size, False)
+                return PaginatedResult([], 0, None, page_size, False)
                 
-            # Calculate offset
-            offset = (page - 1) * page_size
-            
-            # Build query
-            query = self.supabase.rpc(
-                "get_user_summaries",
-                {
-                    "limit_param": page_size,
-                    "offset_param": offset
-                }
-            )
-            
-            if status:
-                query = query.eq("status", status.value)
-                
-            # Execute query
-            response = query.execute()
-            
-            # Get total count (this would be handled differently in a real implementation)
-            total_response = self.supabase.rpc(
-                "get_user_count",
-                {
-                    "status_param": status.value if status else None
-                }
-            ).execute()
+            # Continue strictly after the cursor position, fetching one extra
+            # row to know whether another page follows
+            params = {
+                "limit_param": page_size + 1,
+                "status_param": status.value if status else None
+            }
+            if cursor:
+                cursor_created_at, cursor_id = cursor
+                params["cursor_created_at"] = cursor_created_at.isoformat()
+                params["cursor_id"] = cursor_id
+            page_request = self.supabase.rpc("get_user_summaries", params).execute()
+            
+            # An exact count scans every user, so the total is estimated from
+            # table statistics. The estimate can't apply the status filter, so
+            # a filtered list gets no total
+            if include_total and not status:
+                response, total_response = await asyncio.gather(
+                    page_request,
+                    self.supabase.rpc("estimate_user_count").execute()
+                )
+                total = total_response.data
+            else:
+                response = await page_request
+                total = None
             
-            total = total_response.data[0]["count"] if total_response.data else 0
+            rows = response.data[:page_size]
+            has_more = len(response.data) > page_size
             
             # Create user summaries
-            users = []
-            for user_data in response.data:
-                user = UserSummary(
-                    id=user_data["id"],
-                    email=user_data["email"],
-                    full_name=user_data["full_name"],
-                    role=user_data["role"],
-                    status=UserStatus(user_data["status"]),
-                    created_at=datetime.datetime.fromisoformat(user_data["created_at"]),
-                    conversation_count=user_data["conversation_count"]
-                )
-                users.append(user)
+            users = [_user_summary_from_row(user_data) for user_data in rows]
             
             # Create paginated result
+            last = users[-1] if users else None
             result = PaginatedResult(
                 items=users,
                 total=total,
-                page=page,
+                page=None,
                 page_size=page_size,
-                has_more=(offset + page_size) < total
+                has_more=has_more,
+                next_cursor=(last.created_at, last.id) if has_more and last else None
             )
             
             return result
             
         except Exception as e:
-            logger.error(f"List users error: {str(e)}")
-            return PaginatedResult([], 0, page, page_size, False)
+            logger.error("List users error: %s", e)
+            return PaginatedResult([], 0, None, page_size, False)
     
     async def update_user_role(self, user_id: str, role: str) -> bool:
         """
@@ -567,14 +696,17 @@ class AdminService:
                 return False
                 
             # Update user in database
-            response = self.supabase.table("users").update(
+            response = await self.supabase.table("users").update(
                 {"role": role}
             ).eq("id", user_id).execute()
             
+            # The new role applies from the user's next request
+            self.auth.invalidate_user(user_id)
+            
             return bool(response.data)
             
         except Exception as e:
-            logger.error(f"Update user role error: {str(e)}")
+            logger.error("Update user role error: %s", e)
             return False
     
     async def update_user_status(self, user_id: str, status: UserStatus) -> bool:
@@ -595,18 +727,26 @@ class AdminService:
                 return False
                 
             # Update user in database
-            response = self.supabase.table("users").update(
+            response = await self.supabase.table("users").update(
                 {"status": status.value}
             ).eq("id", user_id).execute()
             
-            # If disabling, invalidate all sessions
-            if status == UserStatus.DISABLED:
-                self.supabase.auth.admin.delete_user(user_id)
+            # The new status applies from the user's next request
+            self.auth.invalidate_user(user_id)
+            
+            # Revoke or restore the user's auth sessions in the background;
+            # the status flag already blocks the account
+            if status in (UserStatus.DISABLED, UserStatus.ACTIVE) and response.data:
+                task = asyncio.get_running_loop().create_task(
+                    self._set_auth_ban(user_id, status == UserStatus.DISABLED)
+                )
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
             
             return bool(response.data)
             
         except Exception as e:
-            logger.error(f"Update user status error: {str(e)}")
+            logger.error("Update user status error: %s", e)
             return False
     
     async def get_conversation_metrics(
@@ -628,12 +768,16 @@ class AdminService:
                 logger.error("Permission denied: User is not an admin")
                 return None
                 
+            # Refresh stale daily buckets in the background; this read serves
+            # the current buckets without waiting for the refresh
+            self._request_metrics_refresh()
+                
             # Calculate date range
             end_date = datetime.datetime.now()
             start_date = self._get_start_date_for_period(end_date, period)
             
             # Get metrics from database
-            response = self.supabase.rpc(
+            response = await self.supabase.rpc(
                 "get_conversation_metrics",
                 {
                     "start_date_param": start_date.isoformat(),
@@ -648,7 +792,7 @@ class AdminService:
             metrics_data = response.data[0]
             
             # Create metrics object
-            result = ConversationMetrics(
+            return ConversationMetrics(
                 total_conversations=metrics_data["total_conversations"],
                 active_users=metrics_data["active_users"],
                 total_turns=metrics_data["total_turns"],
@@ -659,12 +803,106 @@ class AdminService:
                 end_date=end_date
             )
             
-            return result
-            
         except Exception as e:
-            logger.error(f"Get conversation metrics error: {str(e)}")
+            logger.error("Get conversation metrics error: %s", e)
             return None
     
+    def _request_metrics_refresh(self) -> None:
+        """
+        Start a background refresh of the daily conversation metrics, at most
+        once per _METRICS_REFRESH_INTERVAL
+        """
+        now = time.monotonic()
+        if (
+            self._metrics_refresh_requested is not None
+            and now - self._metrics_refresh_requested < _METRICS_REFRESH_INTERVAL
+        ):
+            return
+        self._metrics_refresh_requested = now
+        
+        task = asyncio.get_running_loop().create_task(self._refresh_metrics())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+    
+    async def _refresh_metrics(self) -> None:
+        """
+        Refresh the daily conversation metrics if they are stale
+        """
+        try:
+            await self.supabase.rpc("request_conversation_metrics_refresh", {}).execute()
+        except Exception as e:
+            logger.error("Conversation metrics refresh error: %s", e)
+    
+    async def _set_auth_ban(self, user_id: str, banned: bool) -> None:
+        """
+        Ban or unban a user in Supabase Auth. A banned user's sessions can no
+        longer be refreshed and new sign-ins are refused; the auth user and
+        its data are kept
+        
+        Args:
+            user_id: ID of the user
+            banned: True to ban the user, False to lift the ban
+        """
+        try:
+            await self.supabase.auth.admin.update_user_by_id(
+                user_id,
+                {"ban_duration": _DISABLED_BAN_DURATION if banned else "none"}
+            )
+        except Exception as e:
+            logger.error("Auth ban update error for user %s: %s", user_id, e)
+    
+    @staticmethod
+    def _cache_get(cache: OrderedDict, key: Any) -> Optional[SystemPrompt]:
+        """
+        Get an unexpired prompt from a prompt cache
+        
+        Args:
+            cache: Prompt cache to read
+            key: Prompt ID or category
+            
+        Returns:
+            Cached prompt or None if missing or expired
+        """
+        cached = cache.get(key)
+        if cached and time.monotonic() < cached[0]:
+            cache.move_to_end(key)
+            return cached[1]
+        return None
+    
+    @staticmethod
+    def _cache_put(cache: OrderedDict, key: Any, prompt: SystemPrompt) -> None:
+        """
+        Store a prompt in a prompt cache with a jittered expiry, evicting the
+        least recently used entry when full
+        
+        Args:
+            cache: Prompt cache to write
+            key: Prompt ID or category
+            prompt: Prompt to cache
+        """
+        ttl = _PROMPT_TTL * random.uniform(1 - _PROMPT_TTL_JITTER, 1 + _PROMPT_TTL_JITTER)
+        cache[key] = (time.monotonic() + ttl, prompt)
+        cache.move_to_end(key)
+        if len(cache) > _PROMPT_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _invalidate_prompt(self, prompt_id: str, category: Optional[PromptCategory] = None) -> None:
+        """
+        Drop cached copies of a prompt that changed
+        
+        Args:
+            prompt_id: ID of the prompt that changed
+            category: Category whose default moved, if any; its cached default
+                and the previous default's cached copy are dropped too
+        """
+        self._prompt_cache.pop(prompt_id, None)
+        for key in [key for key, (_, prompt) in self._default_cache.items() if prompt.id == prompt_id or key == category]:
+            del self._default_cache[key]
+            
+        if category is not None:
+            for key in [key for key, (_, prompt) in self._prompt_cache.items() if prompt.category == category and prompt.is_default]:
+                del self._prompt_cache[key]
+    
     def _get_start_date_for_period(
         self, 
         end_date: datetime.datetime, 
@@ -680,16 +918,8 @@ class AdminService:
         Returns:
             Start date of the period
         """
-        if period == MetricsPeriod.DAY:
-            return end_date - datetime.timedelta(days=1)
-        elif period == MetricsPeriod.WEEK:
-            return end_date - datetime.timedelta(weeks=1)
-        elif period == MetricsPeriod.MONTH:
-            return end_date - datetime.timedelta(days=30)
-        elif period == MetricsPeriod.YEAR:
-            return end_date - datetime.timedelta(days=365)
-        else:  # ALL
-            return datetime.datetime(2000, 1, 1)  # Far in the past
+        delta = _PERIOD_DELTAS.get(period)
+        return end_date - delta if delta else _METRICS_EPOCH
 
 
 # Factory function to create admin service
@@ -16,21 +16,57 @@ TDD Test Cases:
 """
 
 import os
-from typing import Dict, Optional, Tuple, Any
-from dataclasses import dataclass
+import asyncio
+import functools
+import re
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple, Any, Sequence, Awaitable
+from dataclasses import dataclass, field
 from enum import Enum
 import logging
 
+from gotrue.errors import AuthApiError
+from postgrest.exceptions import APIError
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Errors raised by Supabase auth and PostgREST; both carry a ready-made message
+_SUPABASE_ERRORS = (AuthApiError, APIError)
+
+# Columns read when building a User from the users table
+USER_COLUMNS = "id,email,full_name,avatar_url,role,created_at,updated_at"
+
+# User columns plus the embedded user_settings row (fetched via a foreign-key join)
+USER_WITH_SETTINGS_COLUMNS = USER_COLUMNS + ",user_settings(theme,language)"
+
+# Basic email shape: local part, "@", domain containing a dot
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Maximum in-flight Supabase requests per service, matching the HTTP connection pool size
+_MAX_CONCURRENT_REQUESTS = 20
+
+# Seconds a fetched user profile is reused before hitting the database again
+_USER_TTL = 60.0
+
+# Seconds a missing user profile is remembered, bounding repeated lookups of absent rows
+_NEG_TTL = 5.0
+
+# Maximum number of user profiles kept in the in-process cache
+_USER_CACHE_SIZE = 1024
+
 # Define user roles
 class UserRole(Enum):
     USER = "user"
     ADMIN = "admin"
 
+# Role lookup by stored value
+_ROLE_BY_VALUE = {role.value: role for role in UserRole}
+
 # User data structure
-@dataclass
+@dataclass(slots=True, frozen=True)
 class User:
     id: str
     email: str
@@ -39,28 +75,80 @@ class User:
     role: UserRole
     created_at: str
     updated_at: str
+    # Excluded from hashing so User stays usable as a cache key
+    settings: Optional[Dict[str, Any]] = field(default=None, hash=False)
 
 # Authentication result
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AuthResult:
     success: bool
     user: Optional[User]
     session: Optional[Dict[str, Any]]
     error: Optional[str]
 
+# Per-request authentication state, so one AuthService can be shared across tasks
+current_user_ctx: ContextVar[Optional[User]] = ContextVar("current_user", default=None)
+current_session_ctx: ContextVar[Optional[Any]] = ContextVar("current_session", default=None)
+
+def _log_unexpected(context: str, error: Exception) -> None:
+    """
+    Log an unexpected error, formatting the traceback only when debugging
+    
+    Args:
+        context: Description of the failed operation
+        error: Exception that was raised
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.exception(context)
+    else:
+        logger.error("%s: %s", context, error)
+
+def _user_from_row(user_data: Dict[str, Any]) -> User:
+    """
+    Build a User from a users table row selected with USER_COLUMNS or
+    USER_WITH_SETTINGS_COLUMNS
+    
+    Args:
+        user_data: Row returned by Supabase
+        
+    Returns:
+        User object
+    """
+    # Embedded resources come back as a list for one-to-many relationships
+    settings = user_data.get("user_settings")
+    if isinstance(settings, list):
+        settings = settings[0] if settings else None
+    
+    return User(
+        id=user_data["id"],
+        email=user_data["email"],
+        full_name=user_data["full_name"],
+        avatar_url=user_data["avatar_url"],
+        role=_ROLE_BY_VALUE[user_data["role"]],
+        created_at=user_data["created_at"],
+        updated_at=user_data["updated_at"],
+        settings=settings
+    )
+
 class AuthService:
     def __init__(self, supabase_client):
         """
         Initialize the authentication service with Supabase client
         
         Args:
-            supabase_client: Initialized Supabase client
+            supabase_client: Initialized async Supabase client (from create_async_client)
         """
         self.supabase = supabase_client
-        self.current_user = None
-        self.current_session = None
+        
+        # User profiles keyed by user id, stamped with time.monotonic() and
+        # kept in least-recently-used order; None records a profile that was
+        # not found
+        self._user_cache: OrderedDict[str, Tuple[Optional[User], float]] = OrderedDict()
+        
+        # Bounds concurrent Supabase requests to the connection pool size
+        self._request_limit = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
     
-    def register(self, email: str, password: str, full_name: str) -> AuthResult:
+    async def register(self, email: str, password: str, full_name: str) -> AuthResult:
         """
         Register a new user
         
@@ -81,7 +169,7 @@ class AuthService:
                 return AuthResult(False, None, None, "Password does not meet requirements")
             
             # Register user with Supabase Auth
-            auth_response = self.supabase.auth.sign_up({
+            auth_response = await self._call(self.supabase.auth.sign_up({
                 "email": email,
                 "password": password,
                 "options": {
@@ -89,46 +177,32 @@ class AuthService:
                         "full_name": full_name
                     }
                 }
-            })
+            }))
             
-            # Create user profile in database
-            user_data = {
-                "id": auth_response.user.id,
+            # Create user profile and default settings in one transaction
+            profile_response = await self._call(self.supabase.rpc("register_user_profile", {
+                "uid": auth_response.user.id,
                 "email": email,
-                "full_name": full_name,
-                "avatar_url": None,
-                "role": UserRole.USER.value
-            }
-            
-            self.supabase.table("users").insert(user_data).execute()
-            
-            # Create default user settings
-            settings_data = {
-                "user_id": auth_response.user.id,
-                "theme": "light",
-                "language": "en-US"
-            }
-            
-            self.supabase.table("user_settings").insert(settings_data).execute()
+                "full_name": full_name
+            }).execute())
             
             # Convert to User object
-            user = User(
-                id=auth_response.user.id,
-                email=email,
-                full_name=full_name,
-                avatar_url=None,
-                role=UserRole.USER,
-                created_at=auth_response.user.created_at,
-                updated_at=auth_response.user.created_at
-            )
+            user_data = profile_response.data
+            user = _user_from_row(user_data)
+            
+            # Make the new profile visible even if a miss was cached for this id
+            self.invalidate_user(user.id)
             
             return AuthResult(True, user, auth_response.session, None)
             
+        except _SUPABASE_ERRORS as e:
+            logger.error("Registration error: %s", e.message)
+            return AuthResult(False, None, None, e.message)
         except Exception as e:
-            logger.error(f"Registration error: {str(e)}")
+            _log_unexpected("Registration error", e)
             return AuthResult(False, None, None, str(e))
     
-    def login(self, email: str, password: str) -> AuthResult:
+    async def login(self, email: str, password: str) -> AuthResult:
         """
         Login a user with email and password
         
@@ -140,41 +214,41 @@ class AuthService:
             AuthResult with success status and user data if successful
         """
         try:
+            # Reject malformed emails before spending a network round-trip
+            if not self._validate_email(email):
+                return AuthResult(False, None, None, "Invalid email format")
+            
             # Authenticate with Supabase
-            auth_response = self.supabase.auth.sign_in_with_password({
+            auth_response = await self._call(self.supabase.auth.sign_in_with_password({
                 "email": email,
                 "password": password
-            })
+            }))
             
-            # Get user profile from database
-            user_response = self.supabase.table("users").select("*").eq("id", auth_response.user.id).single().execute()
+            # Get user profile and settings from database in one request
+            user_response = await self._call(self.supabase.table("users").select(USER_WITH_SETTINGS_COLUMNS).eq("id", auth_response.user.id).limit(1).maybe_single().execute())
             
-            if not user_response.data:
+            # maybe_single() yields no response or empty data when the row is missing
+            if not user_response or not user_response.data:
                 return AuthResult(False, None, None, "User profile not found")
             
             # Convert to User object
             user_data = user_response.data
-            user = User(
-                id=user_data["id"],
-                email=user_data["email"],
-                full_name=user_data["full_name"],
-                avatar_url=user_data["avatar_url"],
-                role=UserRole(user_data["role"]),
-                created_at=user_data["created_at"],
-                updated_at=user_data["updated_at"]
-            )
+            user = _user_from_row(user_data)
             
             # Store current user and session
-            self.current_user = user
-            self.current_session = auth_response.session
+            current_user_ctx.set(user)
+            current_session_ctx.set(auth_response.session)
             
             return AuthResult(True, user, auth_response.session, None)
             
+        except _SUPABASE_ERRORS as e:
+            logger.error("Login error: %s", e.message)
+            return AuthResult(False, None, None, e.message)
         except Exception as e:
-            logger.error(f"Login error: {str(e)}")
+            _log_unexpected("Login error", e)
             return AuthResult(False, None, None, str(e))
     
-    def logout(self) -> bool:
+    async def logout(self) -> bool:
         """
         Logout the current user
         
@@ -182,59 +256,102 @@ class AuthService:
             True if logout was successful, False otherwise
         """
         try:
-            self.supabase.auth.sign_out()
-            self.current_user = None
-            self.current_session = None
+            await self._call(self.supabase.auth.sign_out())
+            current_user = current_user_ctx.get()
+            if current_user:
+                self.invalidate_user(current_user.id)
+            current_user_ctx.set(None)
+            current_session_ctx.set(None)
             return True
+        except _SUPABASE_ERRORS as e:
+            logger.error("Logout error: %s", e.message)
+            return False
         except Exception as e:
-            logger.error(f"Logout error: {str(e)}")
+            _log_unexpected("Logout error", e)
             return False
     
-    def get_current_user(self) -> Optional[User]:
+    async def get_current_user(self) -> Optional[User]:
         """
         Get the currently logged in user
         
         Returns:
             User object if logged in, None otherwise
         """
-        if self.current_user:
-            return self.current_user
+        current_user = current_user_ctx.get()
+        if current_user:
+            return current_user
             
         try:
             # Check if session exists
-            session = self.supabase.auth.get_session()
+            session = await self._call(self.supabase.auth.get_session())
             
             if not session:
                 return None
+            
+            # Reuse a recently fetched profile (or recent miss) for this user
+            cached = self._user_cache.get(session.user.id)
+            if cached:
+                self._user_cache.move_to_end(session.user.id)
+                cached_user, fetched_at = cached
+                age = time.monotonic() - fetched_at
+                if cached_user is None and age < _NEG_TTL:
+                    return None
+                if cached_user is not None and age < _USER_TTL:
+                    current_user_ctx.set(cached_user)
+                    current_session_ctx.set(session)
+                    return cached_user
                 
             # Get user profile from database
-            user_response = self.supabase.table("users").select("*").eq("id", session.user.id).single().execute()
+            user_response = await self._call(self.supabase.table("users").select(USER_COLUMNS).eq("id", session.user.id).limit(1).maybe_single().execute())
             
-            if not user_response.data:
+            # maybe_single() yields no response or empty data when the row is missing
+            if not user_response or not user_response.data:
+                self._cache_user(session.user.id, None)
                 return None
                 
             # Convert to User object
             user_data = user_response.data
-            user = User(
-                id=user_data["id"],
-                email=user_data["email"],
-                full_name=user_data["full_name"],
-                avatar_url=user_data["avatar_url"],
-                role=UserRole(user_data["role"]),
-                created_at=user_data["created_at"],
-                updated_at=user_data["updated_at"]
-            )
-            
-            self.current_user = user
-            self.current_session = session
+            user = _user_from_row(user_data)
+            
+            self._cache_user(user.id, user)
+            current_user_ctx.set(user)
+            current_session_ctx.set(session)
             
             return user
             
+        except _SUPABASE_ERRORS as e:
+            logger.error("Get current user error: %s", e.message)
+            return None
         except Exception as e:
-            logger.error(f"Get current user error: {str(e)}")
+            _log_unexpected("Get current user error", e)
             return None
     
-    def request_password_reset(self, email: str) -> bool:
+    async def get_users(self, ids: Sequence[str]) -> Dict[str, User]:
+        """
+        Get several user profiles with a single query
+        
+        Args:
+            ids: IDs of the users to fetch
+            
+        Returns:
+            Dictionary mapping user ID to User for every profile found
+        """
+        if not ids:
+            return {}
+            
+        try:
+            user_response = await self._call(self.supabase.table("users").select(USER_COLUMNS).in_("id", list(ids)).execute())
+            
+            return {row["id"]: _user_from_row(row) for row in user_response.data}
+            
+        except _SUPABASE_ERRORS as e:
+            logger.error("Get users error: %s", e.message)
+            return {}
+        except Exception as e:
+            _log_unexpected("Get users error", e)
+            return {}
+    
+    async def request_password_reset(self, email: str) -> bool:
         """
         Request a password reset for the given email
         
@@ -245,13 +362,16 @@ class AuthService:
             True if request was successful, False otherwise
         """
         try:
-            self.supabase.auth.reset_password_for_email(email)
+            await self._call(self.supabase.auth.reset_password_for_email(email))
             return True
+        except _SUPABASE_ERRORS as e:
+            logger.error("Password reset request error: %s", e.message)
+            return False
         except Exception as e:
-            logger.error(f"Password reset request error: {str(e)}")
+            _log_unexpected("Password reset request error", e)
             return False
     
-    def complete_password_reset(self, new_password: str, token: str) -> bool:
+    async def complete_password_reset(self, new_password: str, token: str) -> bool:
         """
         Complete a password reset with the given token
         
@@ -266,13 +386,22 @@ class AuthService:
             if not self._validate_password(new_password):
                 return False
                 
-            self.supabase.auth.update_user({
+            update_response = await self._call(self.supabase.auth.update_user({
                 "password": new_password
-            })
+            }))
+            
+            # Drop cached state using the updated auth user rather than
+            # re-reading the profile; get_current_user rebuilds it lazily
+            current_user_ctx.set(None)
+            if update_response and update_response.user:
+                self.invalidate_user(update_response.user.id)
             
             return True
+        except _SUPABASE_ERRORS as e:
+            logger.error("Password reset completion error: %s", e.message)
+            return False
         except Exception as e:
-            logger.error(f"Password reset completion error: {str(e)}")
+            _log_unexpected("Password reset completion error", e)
             return False
     
     def is_admin(self, user: Optional[User] = None) -> bool:
@@ -285,14 +414,14 @@ class AuthService:
         Returns:
             True if user is admin, False otherwise
         """
-        check_user = user or self.current_user
+        check_user = user or current_user_ctx.get()
         
         if not check_user:
             return False
             
         return check_user.role == UserRole.ADMIN
     
-    def refresh_session(self) -> bool:
+    async def refresh_session(self) -> bool:
         """
         Refresh the current session
         
@@ -300,18 +429,60 @@ class AuthService:
             True if refresh was successful, False otherwise
         """
         try:
-            session = self.supabase.auth.refresh_session()
+            session = await self._call(self.supabase.auth.refresh_session())
             
             if session:
-                self.current_session = session
+                current_session_ctx.set(session)
                 return True
             
+            return False
+        except _SUPABASE_ERRORS as e:
+            logger.error("Session refresh error: %s", e.message)
             return False
         except Exception as e:
-            logger.error(f"Session refresh error: {str(e)}")
+            _log_unexpected("Session refresh error", e)
             return False
     
-    def _validate_email(self, email: str) -> bool:
+    async def _call(self, request: Awaitable[Any]) -> Any:
+        """
+        Await a Supabase request while holding a connection pool slot
+        
+        Args:
+            request: Pending Supabase request
+            
+        Returns:
+            Response of the request
+        """
+        async with self._request_limit:
+            return await request
+    
+    def invalidate_user(self, user_id: str) -> None:
+        """
+        Drop a cached user profile so the next lookup reads it from the
+        database; called whenever a profile's role or status changes
+        
+        Args:
+            user_id: ID of the user whose profile changed
+        """
+        self._user_cache.pop(user_id, None)
+    
+    def _cache_user(self, user_id: str, user: Optional[User]) -> None:
+        """
+        Store a fetched user profile (or a miss), evicting the least recently
+        used entry when the cache is full
+        
+        Args:
+            user_id: ID of the user
+            user: Profile, or None if it was not found
+        """
+        self._user_cache[user_id] = (user, time.monotonic())
+        self._user_cache.move_to_end(user_id)
+        if len(self._user_cache) > _USER_CACHE_SIZE:
+            self._user_cache.popitem(last=False)
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _validate_email(email: str) -> bool:
         """
         Validate email format
         
@@ -322,7 +493,7 @@ class AuthService:
             True if email is valid, False otherwise
         """
         # Basic email validation
-        return "@" in email and "." in email.split("@")[1]
+        return _EMAIL_RE.match(email) is not None
     
     def _validate_password(self, password: str) -> bool:
         """
@@ -337,20 +508,18 @@ class AuthService:
         # Password must be at least 8 characters
         if len(password) < 8:
             return False
-            
-        # Password must contain at least one uppercase letter
-        if not any(c.isupper() for c in password):
-            return False
-            
-        # Password must contain at least one lowercase letter
-        if not any(c.islower() for c in password):
-            return False
-            
-        # Password must contain at least one digit
-        if not any(c.isdigit() for c in password):
-            return False
-            
-        return True
+        
+        # Password must contain an uppercase letter, a lowercase letter and a digit;
+        # check all three in a single pass and stop once they have been seen
+        has_upper = has_lower = has_digit = False
+        for c in password:
+            has_upper |= c.isupper()
+            has_lower |= c.islower()
+            has_digit |= c.isdigit()
+            if has_upper and has_lower and has_digit:
+                break
+            
+        return has_upper and has_lower and has_digit
 
 
 # Factory function to create auth service
@@ -359,7 +528,7 @@ def create_auth_service(supabase_client):
     Create and initialize the authentication service
     
     Args:
-        supabase_client: Initialized Supabase client
+        supabase_client: Initialized async Supabase client
         
     Returns:
         Initialized AuthService instance
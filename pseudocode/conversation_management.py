@@ -16,23 +16,42 @@ TDD Test Cases:
 """
 
 import os
+import asyncio
 import json
 import logging
 import datetime
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
 from enum import Enum
 from typing import List, Dict, Optional, Any, Tuple
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import uuid
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Columns read when building list-view conversations (turns are not loaded)
+CONVERSATION_LIST_COLUMNS = "id,user_id,title,system_prompt_id,created_at,updated_at,is_archived"
+
+# Seconds a fetched conversation is reused before hitting the database again
+_CONVERSATION_TTL = 2.0
+
+# Maximum number of conversations kept in the in-process cache
+_CONVERSATION_CACHE_SIZE = 128
+
+# Result of a shared fetch whose owner was cancelled; waiters retry the fetch
+_FETCH_ABANDONED = object()
+
 # Conversation turn role
 class ConversationRole(Enum):
     USER = "user"
     ASSISTANT = "assistant"
     SYSTEM = "system"
 
+# Role lookup by stored value
+_ROLE_CACHE = {role.value: role for role in ConversationRole}
+
 # Export format
 class ExportFormat(Enum):
     TEXT = "text"
@@ -40,17 +59,17 @@ class ExportFormat(Enum):
     AUDIO = "audio"
 
 # Conversation turn
-@dataclass
+@dataclass(slots=True)
 class ConversationTurn:
     id: str
     conversation_id: str
     role: ConversationRole
     content: str
-    audio_url: Optional[str]
+    audio_key: Optional[str]
     created_at: datetime.datetime
 
 # Conversation
-@dataclass
+@dataclass(slots=True)
 class Conversation:
     id: str
     user_id: str
@@ -60,15 +79,23 @@ class Conversation:
     updated_at: datetime.datetime
     is_archived: bool
     turns: List[ConversationTurn]
+    snippet: Optional[str] = None  # Highlighted matching text, set by search results
+
+# Position after the last listed conversation: (updated_at, id)
+ConversationCursor = Tuple[datetime.datetime, str]
 
 # Pagination result
-@dataclass
+@dataclass(slots=True)
 class PaginatedResult:
     items: List[Any]
-    total: int
-    page: int
+    total: Optional[int]  # None when the total was not requested
+    page: Optional[int]  # None for cursor-paginated results
     page_size: int
     has_more: bool
+    next_cursor: Optional[ConversationCursor] = None
+
+# Active conversation of the current request/task, so one service can be shared
+_CURRENT_CONV: ContextVar[Optional[Conversation]] = ContextVar("current_conv", default=None)
 
 class ConversationService:
     def __init__(self, supabase_client, storage_service):
@@ -81,7 +108,13 @@ class ConversationService:
         """
         self.supabase = supabase_client
         self.storage = storage_service
-        self.current_conversation = None
+        
+        # Recently fetched conversations keyed by (conversation_id, user_id),
+        # stamped with time.monotonic() and kept in least-recently-used order
+        self._conv_cache: OrderedDict[Tuple[str, str], Tuple[float, Conversation]] = OrderedDict()
+        
+        # Fetches in progress, shared by concurrent callers asking for the same key
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
     
     async def create_conversation(
         self, 
@@ -103,7 +136,7 @@ class ConversationService:
         try:
             # Generate title if not provided
             if not title:
-                title = f"Conversation {datetime.datetime.now().strftime('%Y-%m-%d %H:%M')}"
+                title = f"Conversation {datetime.datetime.now():%Y-%m-%d %H:%M}"
             
             # Create conversation in database
             conversation_data = {
@@ -136,7 +169,7 @@ class ConversationService:
             )
             
             # Set as current conversation
-            self.current_conversation = result
+            _CURRENT_CONV.set(result)
             
             return result
             
@@ -168,61 +201,59 @@ class ConversationService:
             turn_id = str(uuid.uuid4())
             
             # Upload audio if provided
-            audio_url = None
+            # Only the storage key is kept; URLs are signed when needed
+            audio_key = None
+            audio_duration = None
             if audio_data:
-                audio_path = f"audio_recordings/{conversation_id}/{turn_id}.webm"
-                upload_result = await self.storage.upload_file(audio_path, audio_data)
+                upload_path = f"audio_recordings/{conversation_id}/{turn_id}.webm"
+                upload_result = await self.storage.upload_file(upload_path, audio_data)
                 
                 if upload_result.success:
-                    audio_url = upload_result.url
-                    
-                    # Create audio file record
-                    audio_file_data = {
-                        "id": str(uuid.uuid4()),
-                        "turn_id": turn_id,
-                        "file_path": audio_path,
-                        "duration": upload_result.duration
-                    }
-                    
-                    self.supabase.table("audio_files").insert(audio_file_data).execute()
-            
-            # Create turn in database
-            turn_data = {
-                "id": turn_id,
-                "conversation_id": conversation_id,
-                "role": role.value,
-                "content": content,
-                "audio_url": audio_url
-            }
+                    audio_key = upload_path
+                    audio_duration = upload_result.duration
             
-            response = self.supabase.table("conversation_turns").insert(turn_data).execute()
+            # Create the turn, its audio file record and bump the conversation's
+            # updated_at timestamp in a single round-trip
+            response = self.supabase.rpc(
+                "add_conversation_turn",
+                {
+                    "p_turn_id": turn_id,
+                    "p_conv_id": conversation_id,
+                    "p_role": role.value,
+                    "p_content": content,
+                    "p_audio_key": audio_key,
+                    "p_audio_duration": audio_duration
+                }
+            ).execute()
             
             if not response.data:
                 logger.error("Failed to create conversation turn")
                 return None
                 
             # Get the created turn
-            turn = response.data[0]
-            
-            # Update conversation updated_at timestamp
-            self.supabase.table("conversations").update(
-                {"updated_at": datetime.datetime.now().isoformat()}
-            ).eq("id", conversation_id).execute()
+            turn = response.data
             
             # Create turn object
             result = ConversationTurn(
                 id=turn["id"],
                 conversation_id=turn["conversation_id"],
-                role=ConversationRole(turn["role"]),
+                role=_ROLE_CACHE[turn["role"]],
                 content=turn["content"],
-                audio_url=turn["audio_url"],
+                audio_key=turn["audio_key"],
                 created_at=datetime.datetime.fromisoformat(turn["created_at"])
             )
             
-            # Add to current conversation if it matches
-            if self.current_conversation and self.current_conversation.id == conversation_id:
-                self.current_conversation.turns.append(result)
-                self.current_conversation.updated_at = datetime.datetime.now()
+            self._invalidate_conversation(conversation_id)
+            
+            # Add to current conversation if it matches; a copy is stored so
+            # conversations shared with other tasks are never mutated
+            current = _CURRENT_CONV.get()
+            if current and current.id == conversation_id:
+                _CURRENT_CONV.set(replace(
+                    current,
+                    turns=[*current.turns, result],
+                    updated_at=datetime.datetime.now()
+                ))
             
             return result
             
@@ -234,6 +265,60 @@ class ConversationService:
         """
         Get a conversation by ID
         
+        Args:
+            conversation_id: ID of the conversation to retrieve
+            user_id: ID of the user requesting the conversation
+            
+        Returns:
+            Conversation object or None if not found
+        """
+        key = (conversation_id, user_id)
+        
+        # Reuse a conversation fetched within the last few seconds
+        cached = self._conv_cache.get(key)
+        if cached and time.monotonic() - cached[0] < _CONVERSATION_TTL:
+            self._conv_cache.move_to_end(key)
+            _CURRENT_CONV.set(cached[1])
+            return cached[1]
+        
+        # Share a fetch that is already in progress for the same conversation.
+        # The wait is shielded so a cancelled waiter leaves the fetch running
+        # for the others; if the fetch's owner is cancelled, retry it
+        while (inflight := self._inflight.get(key)) is not None:
+            result = await asyncio.shield(inflight)
+            if result is _FETCH_ABANDONED:
+                continue
+            if result:
+                _CURRENT_CONV.set(result)
+            return result
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._fetch_conversation(conversation_id, user_id)
+            
+            if result:
+                self._conv_cache[key] = (time.monotonic(), result)
+                self._conv_cache.move_to_end(key)
+                if len(self._conv_cache) > _CONVERSATION_CACHE_SIZE:
+                    self._conv_cache.popitem(last=False)
+                
+                # Set as current conversation
+                _CURRENT_CONV.set(result)
+            
+            future.set_result(result)
+            return result
+        finally:
+            # Release waiters even if this fetch was cancelled; they retry it
+            # rather than inherit the cancellation
+            if not future.done():
+                future.set_result(_FETCH_ABANDONED)
+            del self._inflight[key]
+    
+    async def _fetch_conversation(self, conversation_id: str, user_id: str) -> Optional[Conversation]:
+        """
+        Load a conversation and its turns from the database
+        
         Args:
             conversation_id: ID of the conversation to retrieve
             user_id: ID of the user requesting the conversation
@@ -242,26 +327,27 @@ class ConversationService:
             Conversation object or None if not found
         """
         try:
-            # Get conversation from database
-            conversation_response = self.supabase.table("conversations").select("*").eq("id", conversation_id).eq("user_id", user_id).single().execute()
+            # Get conversation and its ordered turns in one round-trip; the
+            # function only returns the conversation if it belongs to the user
+            response = self.supabase.rpc(
+                "get_conversation_with_turns",
+                {"p_conv_id": conversation_id, "p_user_id": user_id}
+            ).execute()
             
-            if not conversation_response.data:
+            if not response.data:
                 logger.error(f"Conversation not found: {conversation_id}")
                 return None
                 
-            conversation = conversation_response.data
-            
-            # Get turns for the conversation
-            turns_response = self.supabase.table("conversation_turns").select("*").eq("conversation_id", conversation_id).order("created_at").execute()
+            conversation = response.data["conv"]
             
             turns = []
-            for turn_data in turns_response.data:
+            for turn_data in response.data["turns"]:
                 turn = ConversationTurn(
                     id=turn_data["id"],
                     conversation_id=turn_data["conversation_id"],
-                    role=ConversationRole(turn_data["role"]),
+                    role=_ROLE_CACHE[turn_data["role"]],
                     content=turn_data["content"],
-                    audio_url=turn_data["audio_url"],
+                    audio_key=turn_data["audio_key"],
                     created_at=datetime.datetime.fromisoformat(turn_data["created_at"])
                 )
                 turns.append(turn)
@@ -278,9 +364,6 @@ class ConversationService:
                 turns=turns
             )
             
-            # Set as current conversation
-            self.current_conversation = result
-            
             return result
             
         except Exception as e:
@@ -290,41 +373,55 @@ class ConversationService:
     async def list_conversations(
         self, 
         user_id: str, 
-        page: int = 1, 
         page_size: int = 10,
-        archived: Optional[bool] = None
+        archived: Optional[bool] = None,
+        cursor: Optional[ConversationCursor] = None,
+        include_total: bool = False
     ) -> PaginatedResult:
         """
-        List conversations for a user with pagination
+        List conversations for a user with keyset pagination
         
         Args:
             user_id: ID of the user
-            page: Page number (1-based)
             page_size: Number of items per page
             archived: Filter by archived status (None for all)
+            cursor: next_cursor of the previous page (None for the first page)
+            include_total: Whether to also count all matching conversations
             
         Returns:
-            Paginated result with conversations
+            Paginated result with conversations and the cursor of the next page
         """
         try:
-            # Calculate offset
-            offset = (page - 1) * page_size
+            # The total comes back with the page itself; an exact count over all of a
+            # user's conversations forces a heap scan, so estimate it when unfiltered
+            count_mode = None
+            if include_total:
+                count_mode = "estimated" if archived is None else "exact"
             
             # Build query
-            query = self.supabase.table("conversations").select("*", count="exact").eq("user_id", user_id)
+            query = self.supabase.table("conversations").select(CONVERSATION_LIST_COLUMNS, count=count_mode).eq("user_id", user_id)
             
             if archived is not None:
                 query = query.eq("is_archived", archived)
-                
-            # Get total count
-            count_response = query.execute()
-            total = count_response.count
             
-            # Get paginated results
-            response = query.order("updated_at", desc=True).range(offset, offset + page_size - 1).execute()
+            # Continue strictly after the cursor position, using id as the tiebreaker
+            if cursor:
+                cursor_updated_at, cursor_id = cursor
+                cursor_ts = cursor_updated_at.isoformat()
+                query = query.or_(
+                    f'updated_at.lt."{cursor_ts}",and(updated_at.eq."{cursor_ts}",id.lt.{cursor_id})'
+                )
+            
+            # Fetch one extra row to know whether another page follows
+            response = query.order("updated_at", desc=True).order("id", desc=True).limit(page_size + 1).execute()
+            
+            rows = response.data[:page_size]
+            has_more = len(response.data) > page_size
+            
+            total = response.count if include_total else None
             
             conversations = []
-            for conversation_data in response.data:
+            for conversation_data in rows:
                 conversation = Conversation(
                     id=conversation_data["id"],
                     user_id=conversation_data["user_id"],
@@ -338,19 +435,21 @@ class ConversationService:
                 conversations.append(conversation)
             
             # Create paginated result
+            last = conversations[-1] if conversations else None
             result = PaginatedResult(
                 items=conversations,
                 total=total,
-                page=page,
+                page=None,
                 page_size=page_size,
-                has_more=(offset + page_size) < total
+                has_more=has_more,
+                next_cursor=(last.updated_at, last.id) if has_more and last else None
             )
             
             return result
             
         except Exception as e:
             logger.error(f"List conversations error: {str(e)}")
-            return PaginatedResult([], 0, page, page_size, False)
+            return PaginatedResult([], 0, None, page_size, False)
     
     async def search_conversations(
         self, 
@@ -372,15 +471,13 @@ class ConversationService:
             Paginated result with matching conversations
         """
         try:
-            # This would use Supabase's text search capabilities
-            # For pseudocode, we'll use a simplified approach
-            
             # Calculate offset
             offset = (page - 1) * page_size
             
-            # Search in conversation turns
+            # Full-text search over the GIN-indexed turn search vectors;
+            # returns one row per conversation, ordered by relevance, with a snippet
             turn_response = self.supabase.rpc(
-                "search_conversation_turns",
+                "search_user_conversation_turns",
                 {
                     "search_query": query,
                     "user_id_param": user_id,
@@ -389,14 +486,18 @@ class ConversationService:
                 }
             ).execute()
             
-            # Get unique conversation IDs from results
-            conversation_ids = list(set([turn["conversation_id"] for turn in turn_response.data]))
+            matches = turn_response.data
             
-            if not conversation_ids:
+            if not matches:
                 return PaginatedResult([], 0, page, page_size, False)
+            
+            # Relevance order and snippets keyed by conversation ID
+            rank_by_id = {match["conversation_id"]: index for index, match in enumerate(matches)}
+            snippet_by_id = {match["conversation_id"]: match["snippet"] for match in matches}
+            conversation_ids = list(rank_by_id)
                 
             # Get conversations by IDs
-            conversation_response = self.supabase.table("conversations").select("*").in_("id", conversation_ids).eq("user_id", user_id).execute()
+            conversation_response = self.supabase.table("conversations").select(CONVERSATION_LIST_COLUMNS).in_("id", conversation_ids).eq("user_id", user_id).execute()
             
             conversations = []
             for conversation_data in conversation_response.data:
@@ -408,18 +509,22 @@ class ConversationService:
                     created_at=datetime.datetime.fromisoformat(conversation_data["created_at"]),
                     updated_at=datetime.datetime.fromisoformat(conversation_data["updated_at"]),
                     is_archived=conversation_data["is_archived"],
-                    turns=[]  # Don't load turns for list view
+                    turns=[],  # Don't load turns for list view
+                    snippet=snippet_by_id[conversation_data["id"]]
                 )
                 conversations.append(conversation)
             
+            # Keep the relevance order computed by the database
+            conversations.sort(key=lambda conversation: rank_by_id[conversation.id])
+            
             # Create paginated result
-            # Note: This is simplified and doesn't handle total count correctly
+            # Note: the total only covers results seen so far; a full page implies more may follow
             result = PaginatedResult(
                 items=conversations,
-                total=len(conversations),  # This would be the actual total in a real implementation
+                total=offset + len(conversations),
                 page=page,
                 page_size=page_size,
-                has_more=False  # This would be calculated correctly in a real implementation
+                has_more=len(matches) == page_size
             )
             
             return result
@@ -465,15 +570,18 @@ class ConversationService:
             
             success = bool(response.data)
             
+            if success:
+                self._invalidate_conversation(conversation_id)
+            
             # Update current conversation if it matches
-            if success and self.current_conversation and self.current_conversation.id == conversation_id:
-                if title is not None:
-                    self.current_conversation.title = title
-                    
-                if is_archived is not None:
-                    self.current_conversation.is_archived = is_archived
-                    
-                self.current_conversation.updated_at = datetime.datetime.now()
+            current = _CURRENT_CONV.get()
+            if success and current and current.id == conversation_id:
+                _CURRENT_CONV.set(replace(
+                    current,
+                    title=title if title is not None else current.title,
+                    is_archived=is_archived if is_archived is not None else current.is_archived,
+                    updated_at=datetime.datetime.now()
+                ))
             
             return success
             
@@ -492,24 +600,49 @@ class ConversationService:
         Returns:
             True if deletion was successful, False otherwise
         """
+        archived_ids = await self.delete_conversations([conversation_id], user_id)
+        return conversation_id in archived_ids
+    
+    async def delete_conversations(self, conversation_ids: List[str], user_id: str) -> List[str]:
+        """
+        Delete several conversations (soft delete by archiving) in one request
+        
+        Args:
+            conversation_ids: IDs of the conversations to delete
+            user_id: ID of the user making the deletion
+            
+        Returns:
+            IDs of the conversations that were archived
+        """
+        if not conversation_ids:
+            return []
+            
         try:
-            # Soft delete by archiving
-            response = self.supabase.table("conversations").update(
-                {"is_archived": True}
-            ).eq("id", conversation_id).eq("user_id", user_id).execute()
+            # Soft delete by archiving; the function returns the IDs it changed
+            response = self.supabase.rpc(
+                "archive_conversations",
+                {"p_ids": conversation_ids, "p_user": user_id}
+            ).execute()
             
-            success = bool(response.data)
+            archived_ids = response.data or []
             
-            # Clear current conversation if it matches
-            if success and self.current_conversation and self.current_conversation.id == conversation_id:
-                self.current_conversation.is_archived = True
-                self.current_conversation.updated_at = datetime.datetime.now()
+            for archived_id in archived_ids:
+                self._invalidate_conversation(archived_id)
             
-            return success
+            # Mark current conversation archived if it matches
+            current = _CURRENT_CONV.get()
+            if current and current.id in archived_ids:
+                _CURRENT_CONV.set(replace(
+                    current,
+                    is_archived=True,
+                    updated_at=datetime.datetime.now()
+                ))
+            
+            return archived_ids
             
         except Exception as e:
-            logger.error(f"Delete conversation error: {str(e)}")
-            return False
+            logger.error(f"Delete conversations error: {str(e)}")
+            return []
     
     async def export_conversation(
         self, 
@@ -529,46 +662,37 @@ class ConversationService:
             Export data or None if export failed
         """
         try:
-            # Get conversation
-            conversation = await self.get_conversation(conversation_id, user_id)
+            # Exports are assembled by the database, so turns are never
+            # materialized as Python objects here
+            params = {"p_id": conversation_id, "p_user": user_id}
+            
+            # Text and JSON exports are stored server-side and rebuilt only
+            # when the conversation's updated_at has changed
+            cached_params = {**params, "p_format": format.value}
             
-            if not conversation:
-                return None
-                
             if format == ExportFormat.TEXT:
                 # Export as text
-                text_content = f"# {conversation.title}\n"
-                text_content += f"Date: {conversation.created_at.strftime('%Y-%m-%d %H:%M')}\n\n"
+                response = self.supabase.rpc("export_conversation_cached", cached_params).execute()
                 
-                for turn in conversation.turns:
-                    speaker = "User" if turn.role == ConversationRole.USER else "Assistant"
-                    text_content += f"{speaker}: {turn.content}\n\n"
+                if not response.data:
+                    return None
                     
                 return {
-                    "content": text_content,
+                    "content": response.data,
                     "filename": f"conversation_{conversation_id}.txt",
                     "mime_type": "text/plain"
                 }
                 
             elif format == ExportFormat.JSON:
                 # Export as JSON
-                json_data = {
-                    "id": conversation.id,
-                    "title": conversation.title,
-                    "created_at": conversation.created_at.isoformat(),
-                    "updated_at": conversation.updated_at.isoformat(),
-                    "turns": [
-                        {
-                            "role": turn.role.value,
-                            "content": turn.content,
-                            "created_at": turn.created_at.isoformat()
-                        }
-                        for turn in conversation.turns
-                    ]
-                }
+                response = self.supabase.rpc("export_conversation_cached", cached_params).execute()
+                
+                if not response.data:
+                    return None
                 
+                # Stored compact; indented here as exports always have been
                 return {
-                    "content": json.dumps(json_data, indent=2),
+                    "content": json.dumps(json.loads(response.data), indent=2),
                     "filename": f"conversation_{conversation_id}.json",
                     "mime_type": "application/json"
                 }
@@ -576,7 +700,14 @@ class ConversationService:
             elif format == ExportFormat.AUDIO:
                 # Export as audio (would combine all audio files)
                 # This is a simplified placeholder
-                audio_urls = [turn.audio_url for turn in conversation.turns if turn.audio_url]
+                response = self.supabase.rpc("export_conversation_audio_paths", params).execute()
+                audio_paths = response.data
+                
+                if not audio_paths:
+                    return None
+                
+                # Sign every file with one storage request rather than one per turn
+                audio_urls = await self.storage.sign_urls(audio_paths, expires_in=3600)
                 
                 if not audio_urls:
                     return None
@@ -593,6 +724,16 @@ class ConversationService:
             logger.error(f"Export conversation error: {str(e)}")
             return None
     
+    def _invalidate_conversation(self, conversation_id: str) -> None:
+        """
+        Drop cached copies of a conversation so the next lookup reads it from the database
+        
+        Args:
+            conversation_id: ID of the conversation that changed
+        """
+        for key in [key for key in self._conv_cache if key[0] == conversation_id]:
+            del self._conv_cache[key]
+    
     def get_current_conversation(self) -> Optional[Conversation]:
         """
         Get the current active conversation
@@ -600,7 +741,7 @@ class ConversationService:
         Returns:
             Current conversation or None if no active conversation
         """
-        return self.current_conversation
+        return _CURRENT_CONV.get()
 
 
 # Factory function to create conversation service
@@ -16,10 +16,14 @@ TDD Test Cases:
 """
 
 import os
+import re
+import sys
 import logging
 from enum import Enum
-from typing import List, Dict, Optional, Any, Callable
-from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Any, Callable, ClassVar, Union
+from dataclasses import dataclass, field, fields, is_dataclass
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -36,27 +40,47 @@ class ComponentSize(Enum):
     LARGE = "large"
 
 # Color palette based on branding guide
-class Colors:
-    PRIMARY = "#00A99D"  # Aqua/Light Blue
-    SECONDARY = "#93278F"  # Dark Purple
-    TERTIARY = "#33475B"  # Cello
-    ACCENT1 = "#F7931E"  # Carrot Orange
-    ACCENT2 = "#29ABE2"  # Summer Sky
-    BACKGROUND = "#FBF7F1"  # Floral White
+COLORS = MappingProxyType({
+    "PRIMARY": "#00A99D",  # Aqua/Light Blue
+    "SECONDARY": "#93278F",  # Dark Purple
+    "TERTIARY": "#33475B",  # Cello
+    "ACCENT1": "#F7931E",  # Carrot Orange
+    "ACCENT2": "#29ABE2",  # Summer Sky
+    "BACKGROUND": "#FBF7F1",  # Floral White
     
     # Additional colors for UI
-    TEXT_PRIMARY = "#333333"
-    TEXT_SECONDARY = "#666666"
-    TEXT_LIGHT = "#FFFFFF"
-    BORDER = "#DDDDDD"
-    ERROR = "#FF3B30"
-    SUCCESS = "#34C759"
-    WARNING = "#FFCC00"
+    "TEXT_PRIMARY": "#333333",
+    "TEXT_SECONDARY": "#666666",
+    "TEXT_LIGHT": "#FFFFFF",
+    "BORDER": "#DDDDDD",
+    "ERROR": "#FF3B30",
+    "SUCCESS": "#34C759",
+    "WARNING": "#FFCC00",
     
     # Dark mode variants
-    DARK_BACKGROUND = "#222222"
-    DARK_SURFACE = "#333333"
-    DARK_BORDER = "#444444"
+    "DARK_BACKGROUND": "#222222",
+    "DARK_SURFACE": "#333333",
+    "DARK_BORDER": "#444444"
+})
+
+# Spacing scale as multiples of the theme's spacing unit
+_SPACING_SCALE = (("xs", 1), ("sm", 2), ("md", 3), ("lg", 4), ("xl", 6))
+
+# Spacing units that can be multiplied out ahead of time
+_SPACING_UNIT_RE = re.compile(r"(\d+(?:\.\d+)?)(px|rem|em)")
+
+# Theme color roles shared by both modes and their palette entries
+_BASE_COLOR_ROLES = (
+    ("primary", "PRIMARY"),
+    ("secondary", "SECONDARY"),
+    ("tertiary", "TERTIARY"),
+    ("accent1", "ACCENT1"),
+    ("accent2", "ACCENT2"),
+    ("textLight", "TEXT_LIGHT"),
+    ("error", "ERROR"),
+    ("success", "SUCCESS"),
+    ("warning", "WARNING")
+)
 
 # Font weights
 class FontWeight(Enum):
@@ -64,104 +88,288 @@ class FontWeight(Enum):
     NORMAL = "normal"
     BOLD = "bold"
 
-# UI Theme
-@dataclass
+# Button variants; anything else is styled as "text"
+BUTTON_VARIANTS = ("primary", "secondary", "tertiary", "text")
+
+# Card box shadows indexed by elevation (0 to 3)
+_SHADOWS = (
+    "none",
+    "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.24)",
+    "0 3px 6px rgba(0,0,0,0.16), 0 3px 6px rgba(0,0,0,0.23)",
+    "0 10px 20px rgba(0,0,0,0.19), 0 6px 6px rgba(0,0,0,0.23)"
+)
+
+# Button vertical padding, horizontal padding (spacing keys) and font size by size
+_BUTTON_SIZES = {
+    ComponentSize.SMALL: ("xs", "sm", "14px"),
+    ComponentSize.MEDIUM: ("sm", "md", "16px"),
+    ComponentSize.LARGE: ("md", "lg", "18px")
+}
+
+# Brightness adjustments used by the style helpers
+SHADE_AMOUNTS = (-25, -15, 80, 90, 95)
+
+def _freeze(style: Dict[str, Any]) -> Mapping[str, Any]:
+    """
+    Return a read-only view of a style dict so it can be shared between components
+    
+    Args:
+        style: Style object, possibly nested
+        
+    Returns:
+        Read-only style mapping
+    """
+    frozen = {}
+    for key, value in style.items():
+        if isinstance(value, dict):
+            value = _freeze(value)
+        elif isinstance(value, str):
+            # Formatted values (borders, padding) are interned so equal strings
+            # across styles and UIComponents instances share one object
+            value = sys.intern(value)
+        frozen[key] = value
+    return MappingProxyType(frozen)
+
+@lru_cache(maxsize=8)
+def _typography_for(font_family: str) -> Mapping[str, Mapping[str, Any]]:
+    """
+    Get the typography scale for a font family, shared by every theme using it
+    
+    Args:
+        font_family: CSS font family
+        
+    Returns:
+        Read-only typography mapping
+    """
+    return _freeze({
+        "h1": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.BOLD.value,
+            "fontSize": "32px",
+            "lineHeight": "40px"
+        },
+        "h2": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.BOLD.value,
+            "fontSize": "24px",
+            "lineHeight": "32px"
+        },
+        "h3": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.BOLD.value,
+            "fontSize": "20px",
+            "lineHeight": "28px"
+        },
+        "body1": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.NORMAL.value,
+            "fontSize": "16px",
+            "lineHeight": "24px"
+        },
+        "body2": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.NORMAL.value,
+            "fontSize": "14px",
+            "lineHeight": "20px"
+        },
+        "caption": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.LIGHT.value,
+            "fontSize": "12px",
+            "lineHeight": "16px"
+        },
+        "button": {
+            "fontFamily": font_family,
+            "fontWeight": FontWeight.BOLD.value,
+            "fontSize": "16px",
+            "lineHeight": "24px",
+            "textTransform": "none"
+        }
+    })
+
+# Theme colors for each mode, resolved once at import
+_BASE_COLORS = {role: COLORS[name] for role, name in _BASE_COLOR_ROLES}
+_LIGHT_COLORS = _freeze({
+    **_BASE_COLORS,
+    "background": COLORS["BACKGROUND"],
+    "surface": "#FFFFFF",
+    "textPrimary": COLORS["TEXT_PRIMARY"],
+    "textSecondary": COLORS["TEXT_SECONDARY"],
+    "border": COLORS["BORDER"]
+})
+_DARK_COLORS = _freeze({
+    **_BASE_COLORS,
+    "background": COLORS["DARK_BACKGROUND"],
+    "surface": COLORS["DARK_SURFACE"],
+    "textPrimary": "#FFFFFF",
+    "textSecondary": "#AAAAAA",
+    "border": COLORS["DARK_BORDER"]
+})
+_COLORS_BY_MODE = {ThemeMode.LIGHT: _LIGHT_COLORS, ThemeMode.DARK: _DARK_COLORS}
+
+# UI Theme; frozen so the derived spacing can be computed once per instance
+@dataclass(frozen=True, slots=True)
 class Theme:
     mode: ThemeMode
     font_family: str = "Montserrat, sans-serif"
     border_radius: str = "8px"
     spacing_unit: str = "8px"
+    _spacing: Mapping[str, str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Read-only view, since the same object is handed to every caller
+        object.__setattr__(self, "_spacing", _freeze(self._build_spacing()))
     
     @property
-    def colors(self) -> Dict[str, str]:
-        base_colors = {
-            "primary": Colors.PRIMARY,
-            "secondary": Colors.SECONDARY,
-            "tertiary": Colors.TERTIARY,
-            "accent1": Colors.ACCENT1,
-            "accent2": Colors.ACCENT2,
-            "error": Colors.ERROR,
-            "success": Colors.SUCCESS,
-            "warning": Colors.WARNING
-        }
+    def colors(self) -> Mapping[str, str]:
+        return _COLORS_BY_MODE[self.mode]
+    
+    @property
+    def spacing(self) -> Mapping[str, str]:
+        return self._spacing
+    
+    @property
+    def typography(self) -> Mapping[str, Mapping[str, Any]]:
+        return _typography_for(self.font_family)
+    
+    def _build_spacing(self) -> Dict[str, str]:
+        unit = self.spacing_unit
         
-        if self.mode == ThemeMode.LIGHT:
-            return {
-                **base_colors,
-                "background": Colors.BACKGROUND,
-                "surface": "#FFFFFF",
-                "textPrimary": Colors.TEXT_PRIMARY,
-                "textSecondary": Colors.TEXT_SECONDARY,
-                "border": Colors.BORDER
+        # A plain length is multiplied out here ("16px") so styles don't carry
+        # a calc() for the browser to resolve; anything else keeps calc()
+        match = _SPACING_UNIT_RE.fullmatch(unit)
+        if match:
+            value, suffix = float(match.group(1)), match.group(2)
+            spacing = {
+                name: f"{value * factor:g}{suffix}"
+                for name, factor in _SPACING_SCALE
             }
         else:
-            return {
-                **base_colors,
-                "background": Colors.DARK_BACKGROUND,
-                "surface": Colors.DARK_SURFACE,
-                "textPrimary": "#FFFFFF",
-                "textSecondary": "#AAAAAA",
-                "border": Colors.DARK_BORDER
+            spacing = {
+                name: unit if factor == 1 else f"calc({unit} * {factor})"
+                for name, factor in _SPACING_SCALE
             }
+        return {name: sys.intern(value) for name, value in spacing.items()}
+
+# Component specs; "type" is the tag the frontend uses to pick a renderer
+@dataclass(slots=True, frozen=True)
+class ButtonSpec:
+    type: ClassVar[str] = "button"
+    label: str
+    on_click: Callable[[], None]
+    variant: str
+    size: str
+    disabled: bool
+    icon: Optional[str]
+    full_width: bool
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class InputSpec:
+    type: ClassVar[str] = "input"
+    label: str
+    value: str
+    on_change: Callable[[str], None]
+    input_type: str
+    placeholder: str
+    error: Optional[str]
+    required: bool
+    disabled: bool
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class CardSpec:
+    type: ClassVar[str] = "card"
+    title: Optional[str]
+    children: List[Any]
+    elevation: int
+    padding: str
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class ConversationBubbleSpec:
+    type: ClassVar[str] = "conversation_bubble"
+    content: str
+    is_user: bool
+    timestamp: str
+    audio_url: Optional[str]
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class VoiceControlSpec:
+    type: ClassVar[str] = "voice_control"
+    is_listening: bool
+    on_toggle: Callable[[bool], None]
+    is_muted: bool
+    on_mute_toggle: Optional[Callable[[bool], None]]
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class ConversationListItemSpec:
+    type: ClassVar[str] = "conversation_list_item"
+    title: str
+    preview: str
+    timestamp: str
+    on_click: Callable[[], None]
+    is_active: bool
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class AdminDashboardCardSpec:
+    type: ClassVar[str] = "admin_dashboard_card"
+    title: str
+    value: str
+    icon: str
+    change_percent: Optional[float]
+    change_label: Optional[str]
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class ModalSpec:
+    type: ClassVar[str] = "modal"
+    title: str
+    children: List[Any]
+    is_open: bool
+    on_close: Callable[[], None]
+    actions: Optional[List[Any]]
+    style: Mapping[str, Any]
+
+@dataclass(slots=True, frozen=True)
+class TabsSpec:
+    type: ClassVar[str] = "tabs"
+    tabs: List[Dict[str, Any]]
+    active_tab: int
+    on_tab_change: Callable[[int], None]
+    style: Mapping[str, Any]
+
+ComponentSpec = Union[
+    ButtonSpec, InputSpec, CardSpec, ConversationBubbleSpec, VoiceControlSpec,
+    ConversationListItemSpec, AdminDashboardCardSpec, ModalSpec, TabsSpec
+]
+
+def component_to_dict(spec: ComponentSpec) -> Dict[str, Any]:
+    """
+    Convert a component spec, including nested children and styles, to plain dicts
     
-    @property
-    def spacing(self) -> Dict[str, str]:
-        unit = self.spacing_unit
-        return {
-            "xs": unit,
-            "sm": f"calc({unit} * 2)",
-            "md": f"calc({unit} * 3)",
-            "lg": f"calc({unit} * 4)",
-            "xl": f"calc({unit} * 6)"
-        }
+    Args:
+        spec: Component spec
+        
+    Returns:
+        Component configuration ready for serialization
+    """
+    def plain(value: Any) -> Any:
+        if is_dataclass(value):
+            return component_to_dict(value)
+        if isinstance(value, Mapping):
+            return {key: plain(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [plain(item) for item in value]
+        return value
     
-    @property
-    def typography(self) -> Dict[str, Dict[str, Any]]:
-        return {
-            "h1": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.BOLD.value,
-                "fontSize": "32px",
-                "lineHeight": "40px"
-            },
-            "h2": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.BOLD.value,
-                "fontSize": "24px",
-                "lineHeight": "32px"
-            },
-            "h3": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.BOLD.value,
-                "fontSize": "20px",
-                "lineHeight": "28px"
-            },
-            "body1": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.NORMAL.value,
-                "fontSize": "16px",
-                "lineHeight": "24px"
-            },
-            "body2": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.NORMAL.value,
-                "fontSize": "14px",
-                "lineHeight": "20px"
-            },
-            "caption": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.LIGHT.value,
-                "fontSize": "12px",
-                "lineHeight": "16px"
-            },
-            "button": {
-                "fontFamily": self.font_family,
-                "fontWeight": FontWeight.BOLD.value,
-                "fontSize": "16px",
-                "lineHeight": "24px",
-                "textTransform": "none"
-            }
-        }
+    config = {"type": spec.type}
+    for spec_field in fields(spec):
+        config[spec_field.name] = plain(getattr(spec, spec_field.name))
+    return config
 
 # UI Components
 class UIComponents:
@@ -173,6 +381,69 @@ class UIComponents:
             theme: UI theme
         """
         self.theme = theme
+        
+        # Shades of the brand colors, keyed by (color role, amount)
+        colors = theme.colors
+        self._shades = {
+            (role, amount): self._adjust_color(colors[role], amount)
+            for role in ("primary", "secondary")
+            for amount in SHADE_AMOUNTS
+        }
+        
+        # Border strings repeated across the style helpers
+        self._border = sys.intern(" ".join(("1px", "solid", colors["border"])))
+        self._border_primary = sys.intern(" ".join(("1px", "solid", colors["primary"])))
+        self._border_error = sys.intern(" ".join(("1px", "solid", colors["error"])))
+        self._border_left_active = sys.intern(" ".join(("4px", "solid", colors["primary"])))
+        
+        # Styles depend only on the theme and a small discriminator, so every
+        # variant is built once here and looked up by key
+        self._button_styles = {
+            (variant, size): _freeze(self._get_button_style(variant, size))
+            for variant in BUTTON_VARIANTS
+            for size in ComponentSize
+        }
+        self._input_styles = {
+            has_error: _freeze(self._get_input_style(has_error))
+            for has_error in (False, True)
+        }
+        self._card_styles = {
+            elevation: _freeze(self._get_card_style(elevation))
+            for elevation in range(4)
+        }
+        self._bubble_styles = {
+            is_user: _freeze(self._get_conversation_bubble_style(is_user))
+            for is_user in (False, True)
+        }
+        self._voice_control_styles = {
+            (is_listening, is_muted): _freeze(self._get_voice_control_style(is_listening, is_muted))
+            for is_listening in (False, True)
+            for is_muted in (False, True)
+        }
+        self._list_item_styles = {
+            is_active: _freeze(self._get_conversation_list_item_style(is_active))
+            for is_active in (False, True)
+        }
+        self._tabs_style = _freeze(self._get_tabs_style())
+    
+    # Modal and admin dashboard styles are built on first use, since most
+    # screens never render them
+    @cached_property
+    def _modal_style(self) -> Mapping[str, Any]:
+        return _freeze(self._get_modal_style())
+    
+    @cached_property
+    def _dashboard_card_styles(self) -> Dict[Optional[bool], Mapping[str, Any]]:
+        # Keyed by None (no change), True (change >= 0) or False (change < 0)
+        return {
+            None: _freeze(self._get_admin_dashboard_card_style(None)),
+            True: _freeze(self._get_admin_dashboard_card_style(0.0)),
+            False: _freeze(self._get_admin_dashboard_card_style(-1.0))
+        }
+    
+    def _dashboard_style_for(self, change_percent: Optional[float]) -> Mapping[str, Any]:
+        key = None if change_percent is None else change_percent >= 0
+        return self._dashboard_card_styles[key]
     
     def button(
         self, 
@@ -183,7 +454,7 @@ class UIComponents:
         disabled: bool = False,
         icon: Optional[str] = None,
         full_width: bool = False
-    ) -> Dict[str, Any]:
+    ) -> ButtonSpec:
         """
         Create a button component
         
@@ -199,17 +470,16 @@ class UIComponents:
         Returns:
             Button component configuration
         """
-        return {
-            "type": "button",
-            "label": label,
-            "on_click": on_click,
-            "variant": variant,
-            "size": size.value,
-            "disabled": disabled,
-            "icon": icon,
-            "full_width": full_width,
-            "style": self._get_button_style(variant, size)
-        }
+        return ButtonSpec(
+            label=label,
+            on_click=on_click,
+            variant=variant,
+            size=size.value,
+            disabled=disabled,
+            icon=icon,
+            full_width=full_width,
+            style=self._button_styles[(variant if variant in BUTTON_VARIANTS else "text", size)]
+        )
     
     def input(
         self, 
@@ -221,7 +491,7 @@ class UIComponents:
         error: Optional[str] = None,
         required: bool = False,
         disabled: bool = False
-    ) -> Dict[str, Any]:
+    ) -> InputSpec:
         """
         Create an input component
         
@@ -238,26 +508,25 @@ class UIComponents:
         Returns:
             Input component configuration
         """
-        return {
-            "type": "input",
-            "label": label,
-            "value": value,
-            "on_change": on_change,
-            "input_type": type,
-            "placeholder": placeholder,
-            "error": error,
-            "required": required,
-            "disabled": disabled,
-            "style": self._get_input_style(bool(error))
-        }
+        return InputSpec(
+            label=label,
+            value=value,
+            on_change=on_change,
+            input_type=type,
+            placeholder=placeholder,
+            error=error,
+            required=required,
+            disabled=disabled,
+            style=self._input_styles[bool(error)]
+        )
     
     def card(
         self, 
-        children: List[Dict[str, Any]], 
+        children: List[ComponentSpec], 
         title: Optional[str] = None,
         elevation: int = 1,
         padding: str = "md"
-    ) -> Dict[str, Any]:
+    ) -> CardSpec:
         """
         Create a card component
         
@@ -270,14 +539,13 @@ class UIComponents:
         Returns:
             Card component configuration
         """
-        return {
-            "type": "card",
-            "title": title,
-            "children": children,
-            "elevation": elevation,
-            "padding": padding,
-            "style": self._get_card_style(elevation)
-        }
+        return CardSpec(
+            title=title,
+            children=children,
+            elevation=elevation,
+            padding=padding,
+            style=self._card_styles[min(max(elevation, 0), 3)]
+        )
     
     def conversation_bubble(
         self, 
@@ -285,7 +553,7 @@ class UIComponents:
         is_user: bool, 
         timestamp: str,
         audio_url: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> ConversationBubbleSpec:
         """
         Create a conversation bubble component
         
@@ -298,14 +566,13 @@ class UIComponents:
         Returns:
             Conversation bubble component configuration
         """
-        return {
-            "type": "conversation_bubble",
-            "content": content,
-            "is_user": is_user,
-            "timestamp": timestamp,
-            "audio_url": audio_url,
-            "style": self._get_conversation_bubble_style(is_user)
-        }
+        return ConversationBubbleSpec(
+            content=content,
+            is_user=is_user,
+            timestamp=timestamp,
+            audio_url=audio_url,
+            style=self._bubble_styles[bool(is_user)]
+        )
     
     def voice_control(
         self, 
@@ -313,7 +580,7 @@ class UIComponents:
         on_toggle: Callable[[bool], None],
         is_muted: bool = False,
         on_mute_toggle: Optional[Callable[[bool], None]] = None
-    ) -> Dict[str, Any]:
+    ) -> VoiceControlSpec:
         """
         Create a voice control component
         
@@ -326,14 +593,13 @@ class UIComponents:
         Returns:
             Voice control component configuration
         """
-        return {
-            "type": "voice_control",
-            "is_listening": is_listening,
-            "on_toggle": on_toggle,
-            "is_muted": is_muted,
-            "on_mute_toggle": on_mute_toggle,
-            "style": self._get_voice_control_style(is_listening, is_muted)
-        }
+        return VoiceControlSpec(
+            is_listening=is_listening,
+            on_toggle=on_toggle,
+            is_muted=is_muted,
+            on_mute_toggle=on_mute_toggle,
+            style=self._voice_control_styles[(bool(is_listening), bool(is_muted))]
+        )
     
     def conversation_list_item(
         self, 
@@ -342,7 +608,7 @@ class UIComponents:
         timestamp: str,
         on_click: Callable[[], None],
         is_active: bool = False
-    ) -> Dict[str, Any]:
+    ) -> ConversationListItemSpec:
         """
         Create a conversation list item component
         
@@ -356,15 +622,14 @@ class UIComponents:
         Returns:
             Conversation list item component configuration
         """
-        return {
-            "type": "conversation_list_item",
-            "title": title,
-            "preview": preview,
-            "timestamp": timestamp,
-            "on_click": on_click,
-            "is_active": is_active,
-            "style": self._get_conversation_list_item_style(is_active)
-        }
+        return ConversationListItemSpec(
+            title=title,
+            preview=preview,
+            timestamp=timestamp,
+            on_click=on_click,
+            is_active=is_active,
+            style=self._list_item_styles[bool(is_active)]
+        )
     
     def admin_dashboard_card(
         self, 
@@ -373,7 +638,7 @@ class UIComponents:
         icon: str,
         change_percent: Optional[float] = None,
         change_label: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> AdminDashboardCardSpec:
         """
         Create an admin dashboard card component
         
@@ -387,24 +652,23 @@ class UIComponents:
         Returns:
             Admin dashboard card component configuration
         """
-        return {
-            "type": "admin_dashboard_card",
-            "title": title,
-            "value": value,
-            "icon": icon,
-            "change_percent": change_percent,
-            "change_label": change_label,
-            "style": self._get_admin_dashboard_card_style(change_percent)
-        }
+        return AdminDashboardCardSpec(
+            title=title,
+            value=value,
+            icon=icon,
+            change_percent=change_percent,
+            change_label=change_label,
+            style=self._dashboard_style_for(change_percent)
+        )
     
     def modal(
         self, 
         title: str, 
-        children: List[Dict[str, Any]], 
+        children: List[ComponentSpec], 
         is_open: bool,
         on_close: Callable[[], None],
-        actions: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
+        actions: Optional[List[ButtonSpec]] = None
+    ) -> ModalSpec:
         """
         Create a modal component
         
@@ -418,22 +682,21 @@ class UIComponents:
         Returns:
             Modal component configuration
         """
-        return {
-            "type": "modal",
-            "title": title,
-            "children": children,
-            "is_open": is_open,
-            "on_close": on_close,
-            "actions": actions,
-            "style": self._get_modal_style()
-        }
+        return ModalSpec(
+            title=title,
+            children=children,
+            is_open=is_open,
+            on_close=on_close,
+            actions=actions,
+            style=self._modal_style
+        )
     
     def tabs(
         self, 
         tabs: List[Dict[str, Any]], 
         active_tab: int,
         on_tab_change: Callable[[int], None]
-    ) -> Dict[str, Any]:
+    ) -> TabsSpec:
         """
         Create a tabs component
         
@@ -445,13 +708,12 @@ class UIComponents:
         Returns:
             Tabs component configuration
         """
-        return {
-            "type": "tabs",
-            "tabs": tabs,
-            "active_tab": active_tab,
-            "on_tab_change": on_tab_change,
-            "style": self._get_tabs_style()
-        }
+        return TabsSpec(
+            tabs=tabs,
+            active_tab=active_tab,
+            on_tab_change=on_tab_change,
+            style=self._tabs_style
+        )
     
     def _get_button_style(self, variant: str, size: ComponentSize) -> Dict[str, Any]:
         """
@@ -477,21 +739,11 @@ class UIComponents:
         }
         
         # Size styles
-        if size == ComponentSize.SMALL:
-            size_style = {
-                "padding": f"{spacing['xs']} {spacing['sm']}",
-                "fontSize": "14px"
-            }
-        elif size == ComponentSize.LARGE:
-            size_style = {
-                "padding": f"{spacing['md']} {spacing['lg']}",
-                "fontSize": "18px"
-            }
-        else:  # MEDIUM
-            size_style = {
-                "padding": f"{spacing['sm']} {spacing['md']}",
-                "fontSize": "16px"
-            }
+        padding_y, padding_x, font_size = _BUTTON_SIZES[size]
+        size_style = {
+            "padding": f"{spacing[padding_y]} {spacing[padding_x]}",
+            "fontSize": font_size
+        }
         
         # Variant styles
         if variant == "primary":
@@ -499,35 +751,35 @@ class UIComponents:
                 "backgroundColor": colors["primary"],
                 "color": colors["textLight"],
                 "border": "none",
-                "hoverBackgroundColor": self._adjust_color(colors["primary"], -15),
-                "activeBackgroundColor": self._adjust_color(colors["primary"], -25)
+                "hoverBackgroundColor": self._shades[("primary", -15)],
+                "activeBackgroundColor": self._shades[("primary", -25)]
             }
         elif variant == "secondary":
             variant_style = {
                 "backgroundColor": colors["secondary"],
                 "color": colors["textLight"],
                 "border": "none",
-                "hoverBackgroundColor": self._adjust_color(colors["secondary"], -15),
-                "activeBackgroundColor": self._adjust_color(colors["secondary"], -25)
+                "hoverBackgroundColor": self._shades[("secondary", -15)],
+                "activeBackgroundColor": self._shades[("secondary", -25)]
             }
         elif variant == "tertiary":
             variant_style = {
                 "backgroundColor": "transparent",
                 "color": colors["primary"],
-                "border": f"1px solid {colors['primary']}",
-                "hoverBackgroundColor": self._adjust_color(colors["primary"], 90),
-                "activeBackgroundColor": self._adjust_color(colors["primary"], 80)
+                "border": self._border_primary,
+                "hoverBackgroundColor": self._shades[("primary", 90)],
+                "activeBackgroundColor": self._shades[("primary", 80)]
             }
         else:  # text
             variant_style = {
                 "backgroundColor": "transparent",
                 "color": colors["primary"],
                 "border": "none",
-                "hoverBackgroundColor": self._adjust_color(colors["primary"], 90),
-                "activeBackgroundColor": self._adjust_color(colors["primary"], 80)
+                "hoverBackgroundColor": self._shades[("primary", 90)],
+                "activeBackgroundColor": self._shades[("primary", 80)]
             }
         
-        return {**base_style, **size_style, **variant_style}
+        return base_style | size_style | variant_style
     
     def _get_input_style(self, has_error: bool) -> Dict[str, Any]:
         """
@@ -542,7 +794,7 @@ class UIComponents:
         colors = self.theme.colors
         spacing = self.theme.spacing
         
-        border_color = colors["error"] if has_error else colors["border"]
+        border = self._border_error if has_error else self._border
         
         return {
             "container": {
@@ -559,7 +811,7 @@ class UIComponents:
                 "width": "100%",
                 "padding": spacing["sm"],
                 "borderRadius": self.theme.border_radius,
-                "border": f"1px solid {border_color}",
+                "border": border,
                 "fontSize": "16px",
                 "backgroundColor": colors["surface"],
                 "color": colors["textPrimary"],
@@ -586,13 +838,7 @@ class UIComponents:
         colors = self.theme.colors
         spacing = self.theme.spacing
         
-        shadow = "none"
-        if elevation == 1:
-            shadow = "0 1px 3px rgba(0,0,0,0.12), 0 1px 2px rgba(0,0,0,0.24)"
-        elif elevation == 2:
-            shadow = "0 3px 6px rgba(0,0,0,0.16), 0 3px 6px rgba(0,0,0,0.23)"
-        elif elevation >= 3:
-            shadow = "0 10px 20px rgba(0,0,0,0.19), 0 6px 6px rgba(0,0,0,0.23)"
+        shadow = _SHADOWS[min(max(elevation, 0), 3)]
         
         return {
             "backgroundColor": colors["surface"],
@@ -601,7 +847,7 @@ class UIComponents:
             "overflow": "hidden",
             "title": {
                 "padding": spacing["md"],
-                "borderBottom": f"1px solid {colors['border']}",
+                "borderBottom": self._border,
                 "fontWeight": FontWeight.BOLD.value,
                 "fontSize": "18px"
             },
@@ -625,7 +871,7 @@ class UIComponents:
         
         background_color = colors["primary"] if is_user else colors["surface"]
         text_color = colors["textLight"] if is_user else colors["textPrimary"]
-        border = "none" if is_user else f"1px solid {colors['border']}"
+        border = "none" if is_user else self._border
         align = "flex-end" if is_user else "flex-start"
         
         return {
@@ -699,8 +945,8 @@ class UIComponents:
                 "height": "40px",
                 "borderRadius": "50%",
                 "backgroundColor": colors["surface"],
-                "color": is_muted ? colors["warning"] : colors["textSecondary"],
-                "border": f"1px solid {colors['border']}",
+                "color": colors["warning"] if is_muted else colors["textSecondary"],
+                "border": self._border,
                 "marginLeft": spacing["md"],
                 "cursor": "pointer"
             }
@@ -719,18 +965,18 @@ class UIComponents:
         colors = self.theme.colors
         spacing = self.theme.spacing
         
-        background_color = self._adjust_color(colors["primary"], 90) if is_active else colors["surface"]
-        border_left = f"4px solid {colors['primary']}" if is_active else "4px solid transparent"
+        background_color = self._shades[("primary", 90)] if is_active else colors["surface"]
+        border_left = self._border_left_active if is_active else "4px solid transparent"
         
         return {
             "container": {
                 "padding": spacing["md"],
-                "borderBottom": f"1px solid {colors['border']}",
+                "borderBottom": self._border,
                 "backgroundColor": background_color,
                 "borderLeft": border_left,
                 "cursor": "pointer",
                 "transition": "background-color 0.2s ease-in-out",
-                "hoverBackgroundColor": self._adjust_color(colors["primary"], 95)
+                "hoverBackgroundColor": self._shades[("primary", 95)]
             },
             "title": {
                 "fontWeight": FontWeight.BOLD.value,
@@ -832,7 +1078,7 @@ class UIComponents:
             },
             "header": {
                 "padding": spacing["md"],
-                "borderBottom": f"1px solid {colors['border']}",
+                "borderBottom": self._border,
                 "display": "flex",
                 "alignItems": "center",
                 "justifyContent": "space-between"
@@ -852,7 +1098,7 @@ class UIComponents:
             },
             "footer": {
                 "padding": spacing["md"],
-                "borderTop": f"1px solid {colors['border']}",
+                "borderTop": self._border,
                 "display": "flex",
                 "justifyContent": "flex-end",
                 "gap": spacing["sm"]
@@ -871,14 +1117,14 @@ class UIComponents:
         
         return {
             "container": {
-                "borderBottom": f"1px solid {colors['border']}"
+                "borderBottom": self._border
             },
             "tabList": {
                 "display": "flex",
                 "overflow": "auto"
             },
             "tab": {
-                "padding": `${spacing["sm"]} ${spacing["md"]}`,
+                "padding": f"{spacing['sm']} {spacing['md']}",
                 "cursor": "pointer",
                 "borderBottom": "2px solid transparent",
                 "transition": "all 0.2s ease-in-out",
@@ -894,9 +1140,11 @@ class UIComponents:
             }
         }
     
-    def _adjust_color(self, hex_color: str, amount: int) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _adjust_color(hex_color: str, amount: int) -> str:
         """
-        Adjust color brightness
+        Adjust color brightness; cached for callers outside the shade table
         
         Args:
             hex_color: Hex color code
@@ -910,6 +1158,13 @@ class UIComponents:
         return hex_color
 
 
+# UIComponents holds only theme-derived state, so one instance (and one set of
+# style tables) is shared per theme
+@lru_cache(maxsize=16)
+def _ui_components_for(theme: Theme) -> UIComponents:
+    return UIComponents(theme)
+
+
 # Factory function to create UI components
 def create_ui_components(theme_mode: ThemeMode = ThemeMode.LIGHT) -> UIComponents:
     """
@@ -922,4 +1177,4 @@ def create_ui_components(theme_mode: ThemeMode = ThemeMode.LIGHT) -> UIComponent
         Initialized UIComponents instance
     """
     theme = Theme(mode=theme_mode)
-    return UIComponents(theme)
\ No newline at end of file
+    return _ui_components_for(theme)
\ No newline at end of file
@@ -16,11 +16,20 @@ TDD Test Cases:
 """
 
 import os
+import math
+import time
+import queue
+import random
+import asyncio
+import inspect
 import logging
+import threading
 from enum import Enum
-from typing import Optional, Callable, List, Dict, Any
+from typing import Optional, Callable, List, Dict, Any, AsyncIterator, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -31,6 +40,14 @@ class AudioQuality(Enum):
     HIGH = "high"     # 24kHz, 128kbps
     ULTRA = "ultra"   # 48kHz, 256kbps
 
+# Bitrate in bps for each audio quality preset
+_BITRATE_BY_QUALITY = {
+    AudioQuality.LOW: 32000,
+    AudioQuality.MEDIUM: 64000,
+    AudioQuality.HIGH: 128000,
+    AudioQuality.ULTRA: 256000
+}
+
 # Connection state
 class ConnectionState(Enum):
     DISCONNECTED = "disconnected"
@@ -40,7 +57,7 @@ class ConnectionState(Enum):
     ERROR = "error"
 
 # Audio device
-@dataclass
+@dataclass(slots=True)
 class AudioDevice:
     id: str
     name: str
@@ -52,7 +69,7 @@ class VoiceActivityState(Enum):
     ACTIVE = "active"
 
 # LiveKit connection options
-@dataclass
+@dataclass(slots=True)
 class LiveKitOptions:
     url: str
     token: str
@@ -64,6 +81,409 @@ class LiveKitOptions:
     enable_auto_gain_control: bool = True
     audio_quality: AudioQuality = AudioQuality.MEDIUM
 
+# Silero VAD frame: 512 samples of 16 kHz mono int16 PCM (32 ms)
+VAD_SAMPLE_RATE = 16000
+VAD_FRAME_SAMPLES = 512
+
+# Speech starts at the start threshold and ends after VAD_MIN_SILENCE_MS
+# below the end threshold
+VAD_START_THRESHOLD = 0.7
+VAD_END_THRESHOLD = 0.5
+VAD_MIN_SILENCE_MS = 57
+
+# Frames whose mean energy stays within VAD_ENERGY_RATIO of the running noise
+# floor skip the model and count as silence; the floor tracks non-speech
+# frames with an exponential moving average
+VAD_ENERGY_RATIO = 3.0
+VAD_NOISE_FLOOR_ALPHA = 0.01
+VAD_MIN_NOISE_FLOOR = 100.0
+
+# Silero VAD ONNX model
+VAD_MODEL_PATH = os.environ.get("SILERO_VAD_MODEL_PATH", "silero_vad.onnx")
+
+class SileroVadEngine:
+    def __init__(self, model_path: str = VAD_MODEL_PATH, input_rate: int = VAD_SAMPLE_RATE):
+        """
+        Load the Silero VAD model into an ONNX Runtime session
+        
+        Args:
+            model_path: Path to the Silero VAD ONNX model
+            input_rate: Sample rate of the PCM passed to process(), a
+                multiple of VAD_SAMPLE_RATE
+        """
+        if input_rate % VAD_SAMPLE_RATE:
+            raise ValueError(f"input_rate must be a multiple of {VAD_SAMPLE_RATE}")
+            
+        # Imported here so the module loads without onnxruntime installed
+        import onnxruntime as ort
+        
+        self.session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self._decimation = input_rate // VAD_SAMPLE_RATE
+        self._sample_rate = np.array(VAD_SAMPLE_RATE, dtype=np.int64)
+        self._frame = np.zeros(VAD_FRAME_SAMPLES, dtype=np.int16)
+        self._min_silence_frames = math.ceil(
+            VAD_MIN_SILENCE_MS * VAD_SAMPLE_RATE / 1000 / VAD_FRAME_SAMPLES
+        )
+        self.reset()
+    
+    def reset(self) -> None:
+        """
+        Clear the model state, buffered samples and activity state
+        """
+        self._h = np.zeros((2, 1, 64), dtype=np.float32)
+        self._c = np.zeros((2, 1, 64), dtype=np.float32)
+        self._frame_fill = 0
+        self._resample_tail = np.zeros(0, dtype=np.int16)
+        self._silent_frames = 0
+        self._noise_floor = VAD_MIN_NOISE_FLOOR
+        self.is_active = False
+    
+    def process(self, pcm: bytes) -> List[bool]:
+        """
+        Buffer PCM samples and run the model on every complete frame
+        
+        Args:
+            pcm: Mono int16 PCM at the engine's input rate
+            
+        Returns:
+            Activity transitions in order (True when speech starts, False when it ends)
+        """
+        samples = self._resample(np.frombuffer(pcm, dtype=np.int16))
+        transitions = []
+        
+        while samples.size:
+            take = min(VAD_FRAME_SAMPLES - self._frame_fill, samples.size)
+            self._frame[self._frame_fill:self._frame_fill + take] = samples[:take]
+            self._frame_fill += take
+            samples = samples[take:]
+            
+            if self._frame_fill < VAD_FRAME_SAMPLES:
+                break
+            self._frame_fill = 0
+            
+            energy = self._frame_energy(self._frame)
+            if energy > self._noise_floor * VAD_ENERGY_RATIO:
+                probability = self._speech_probability(self._frame)
+            else:
+                probability = 0.0
+            
+            if probability < VAD_END_THRESHOLD:
+                self._noise_floor = max(
+                    VAD_MIN_NOISE_FLOOR,
+                    self._noise_floor + VAD_NOISE_FLOOR_ALPHA * (energy - self._noise_floor)
+                )
+            
+            if self._update(probability):
+                transitions.append(self.is_active)
+        
+        return transitions
+    
+    def _resample(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Downsample input PCM to VAD_SAMPLE_RATE by averaging each group of
+        samples, which also filters out frequencies the model can't use
+        
+        Args:
+            samples: int16 samples at the input rate
+            
+        Returns:
+            int16 samples at VAD_SAMPLE_RATE; a trailing partial group is
+            kept for the next call
+        """
+        if self._decimation == 1:
+            return samples
+            
+        if self._resample_tail.size:
+            samples = np.concatenate((self._resample_tail, samples))
+        usable = samples.size - samples.size % self._decimation
+        self._resample_tail = samples[usable:].copy()
+        
+        groups = samples[:usable].reshape(-1, self._decimation).astype(np.int32)
+        return (groups.sum(axis=1) // self._decimation).astype(np.int16)
+    
+    @staticmethod
+    def _frame_energy(frame: np.ndarray) -> float:
+        """
+        Mean energy of a frame, computed as an integer dot product
+        
+        Args:
+            frame: VAD_FRAME_SAMPLES int16 samples
+            
+        Returns:
+            Mean squared amplitude
+        """
+        samples = frame.astype(np.int64)
+        return float(np.dot(samples, samples)) / frame.size
+    
+    def _speech_probability(self, frame: np.ndarray) -> float:
+        """
+        Run the model on one frame, carrying the LSTM state to the next
+        
+        Args:
+            frame: VAD_FRAME_SAMPLES int16 samples
+            
+        Returns:
+            Probability that the frame contains speech
+        """
+        samples = (frame.astype(np.float32) / 32768.0)[np.newaxis, :]
+        output, self._h, self._c = self.session.run(
+            None,
+            {"input": samples, "sr": self._sample_rate, "h": self._h, "c": self._c}
+        )
+        return float(output[0][0])
+    
+    def _update(self, probability: float) -> bool:
+        """
+        Apply the start/end hysteresis to a frame's speech probability
+        
+        Args:
+            probability: Speech probability of the latest frame
+            
+        Returns:
+            True if the activity state changed
+        """
+        if not self.is_active:
+            if probability >= VAD_START_THRESHOLD:
+                self.is_active = True
+                self._silent_frames = 0
+                return True
+            return False
+        
+        if probability >= VAD_END_THRESHOLD:
+            self._silent_frames = 0
+            return False
+        
+        self._silent_frames += 1
+        if self._silent_frames < self._min_silence_frames:
+            return False
+        
+        self.is_active = False
+        return True
+
+# Headless agents have no browser to run echo cancellation, noise suppression
+# and gain control, so capture goes through the native WebRTC APM instead
+HEADLESS_MODE = bool(os.environ.get("VOICE_AGENT_HEADLESS"))
+
+# The APM works on 10 ms blocks: 480 samples of 48 kHz int16 PCM per channel
+APM_SAMPLE_RATE = 48000
+APM_FRAME_SAMPLES = 480
+
+class NativeApm:
+    def __init__(
+        self,
+        echo_cancellation: bool = True,
+        noise_suppression: bool = True,
+        auto_gain_control: bool = True
+    ):
+        """
+        Native WebRTC audio processing for 48 kHz mono capture, with 48 kHz
+        stereo remote audio as the echo reference
+        
+        Args:
+            echo_cancellation: Whether to cancel echo of the remote audio
+            noise_suppression: Whether to suppress background noise
+            auto_gain_control: Whether to normalize the capture level
+        """
+        # Only headless capture needs the native APM, so it is imported here
+        from webrtc_audio_processing import AudioProcessingModule as WebRtcApm
+        
+        self.echo_cancellation = echo_cancellation
+        self._apm = WebRtcApm(
+            aec_type=1 if echo_cancellation else 0,
+            enable_ns=noise_suppression,
+            agc_type=1 if auto_gain_control else 0,
+            enable_vad=False
+        )
+        self._apm.set_stream_format(APM_SAMPLE_RATE, 1)
+        self._apm.set_reverse_stream_format(APM_SAMPLE_RATE, 2)
+        self._frame_bytes = APM_FRAME_SAMPLES * 2
+        self._reverse_frame_bytes = APM_FRAME_SAMPLES * 4
+        self._reverse_tail = b""
+    
+    def process_stream(self, frame: bytes) -> bytes:
+        """
+        Run denoise, gain control and echo cancellation on a capture frame
+        
+        Args:
+            frame: 10 ms of 48 kHz mono int16 PCM
+            
+        Returns:
+            Processed frame of the same size
+        """
+        if len(frame) != self._frame_bytes:
+            raise ValueError(f"APM frames must be {self._frame_bytes} bytes")
+        return self._apm.process_stream(frame)
+    
+    def process_reverse_stream(self, data: bytes) -> None:
+        """
+        Feed remote audio to the echo canceller as the far-end reference
+        
+        Args:
+            data: 48 kHz stereo int16 PCM; a trailing partial block is kept
+                for the next call so the reference stays aligned
+        """
+        if not self.echo_cancellation:
+            return
+        if self._reverse_tail:
+            data = self._reverse_tail + data
+        view = memoryview(data)
+        usable = len(view) - len(view) % self._reverse_frame_bytes
+        for offset in range(0, usable, self._reverse_frame_bytes):
+            self._apm.process_reverse_stream(bytes(view[offset:offset + self._reverse_frame_bytes]))
+        self._reverse_tail = bytes(view[usable:])
+
+# Rooms are reused for this long after their last use, so reconnects within
+# the window keep the existing signaling and media transport
+_ROOM_TTL = 30.0
+
+@dataclass(slots=True)
+class _RoomEntry:
+    room: Any
+    expires: float
+    # VoiceService whose event listeners are registered on the room
+    owner: Any = None
+
+# (url, token) -> cached room; the token identifies the participant, so two
+# participants never share a room. Entries expire on the monotonic clock
+_ROOM_CACHE: Dict[Tuple[str, str], _RoomEntry] = {}
+
+# Reconnect backoff: each delay is drawn between the base delay and three
+# times the previous one (decorrelated jitter), capped at the maximum
+_RECONNECT_BASE_DELAY = 0.5
+_RECONNECT_MAX_DELAY = 60.0
+_RECONNECT_MAX_TRIES = 8
+
+def _is_fatal_error(error: Any) -> bool:
+    """
+    Check whether a room error means the room can't be reused (auth or other 4xx)
+    
+    Args:
+        error: Error object from LiveKit
+        
+    Returns:
+        True if the error is fatal
+    """
+    status = getattr(error, "status", None) or getattr(error, "code", None)
+    return isinstance(status, int) and 400 <= status < 500
+
+def _room_key(options: LiveKitOptions) -> Tuple[str, str]:
+    """
+    Get the room cache key for a set of connection options
+    
+    Args:
+        options: LiveKit connection options
+        
+    Returns:
+        (url, token) key
+    """
+    return (options.url, options.token)
+
+def _room_in_use(entry: _RoomEntry) -> bool:
+    """
+    Check whether a cached room is still connected for its owner
+    
+    Args:
+        entry: Cached room
+        
+    Returns:
+        True if the owner holds the room and is connected or connecting
+    """
+    owner = entry.owner
+    return (
+        owner is not None
+        and owner.room is entry.room
+        and owner.connection_state in (
+            ConnectionState.CONNECTING,
+            ConnectionState.CONNECTED,
+            ConnectionState.RECONNECTING
+        )
+    )
+
+async def _disconnect_rooms(rooms: List[Any]) -> None:
+    """
+    Disconnect rooms evicted from the cache
+    
+    Args:
+        rooms: LiveKit room instances
+    """
+    results = await asyncio.gather(*(room.disconnect() for room in rooms), return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            logger.error("LiveKit disconnection error: %s", result)
+
+# Remote audio ring: slots hold up to 10 ms of 48 kHz stereo int16 audio
+AUDIO_RING_CAPACITY = 1024
+AUDIO_FRAME_BYTES = 1920
+
+class AudioRing:
+    def __init__(self, capacity: int = AUDIO_RING_CAPACITY, frame_bytes: int = AUDIO_FRAME_BYTES):
+        """
+        Single-producer ring of audio frames read by independent consumers
+        
+        Args:
+            capacity: Number of slots (a power of two)
+            frame_bytes: Size of each slot in bytes
+        """
+        if capacity <= 0 or capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+            
+        self.capacity = capacity
+        self.frame_bytes = frame_bytes
+        self.head = 0
+        self._mask = capacity - 1
+        self._arena = bytearray(capacity * frame_bytes)
+        self._view = memoryview(self._arena)
+        self._lengths = [0] * capacity
+        self._published = asyncio.Event()
+    
+    def publish(self, data: bytes) -> None:
+        """
+        Copy audio into the next slots; never waits for consumers
+        
+        Must be called on the event loop thread the consumers run on, since
+        it moves the head and sets an asyncio.Event
+        
+        Args:
+            data: Audio data bytes, split across slots if larger than one
+        """
+        view = memoryview(data)
+        for offset in range(0, len(view), self.frame_bytes):
+            chunk = view[offset:offset + self.frame_bytes]
+            slot = self.head & self._mask
+            start = slot * self.frame_bytes
+            self._arena[start:start + len(chunk)] = chunk
+            self._lengths[slot] = len(chunk)
+            self.head += 1
+        
+        # Wake every waiting consumer; later waits use a fresh event
+        published, self._published = self._published, asyncio.Event()
+        published.set()
+    
+    async def consume(self) -> AsyncIterator[memoryview]:
+        """
+        Iterate over frames published after this call
+        
+        Frames are views into the ring itself rather than copies. A view must
+        be used (or copied with bytes()) before the consumer next awaits,
+        since the producer reuses the slot once the ring wraps
+        
+        Returns:
+            Async iterator of audio frames; a consumer more than a full ring
+            behind skips ahead to the oldest frame still held
+        """
+        cursor = self.head
+        while True:
+            while cursor == self.head:
+                await self._published.wait()
+                
+            if self.head - cursor > self.capacity:
+                cursor = self.head - self.capacity
+                
+            slot = cursor & self._mask
+            start = slot * self.frame_bytes
+            cursor += 1
+            yield self._view[start:start + self._lengths[slot]]
+
 class VoiceService:
     def __init__(self, livekit_options: LiveKitOptions):
         """
@@ -74,16 +494,34 @@ class VoiceService:
         """
         self.options = livekit_options
         self.room = None
+        self._room_listeners = []
         self.local_track = None
         self.remote_tracks = {}
         self.connection_state = ConnectionState.DISCONNECTED
+        self._last_notified_state = None
         self.is_muted = False
         self.voice_activity_state = VoiceActivityState.INACTIVE
-        self.on_state_change_callbacks = []
-        self.on_voice_activity_callbacks = []
-        self.on_remote_audio_callbacks = []
+        # Callbacks are split into sync and async tuples when registered, so
+        # dispatch needs no per-call type checks
+        self._sync_state_callbacks = ()
+        self._async_state_callbacks = ()
+        self._sync_voice_activity_callbacks = ()
+        self._async_voice_activity_callbacks = ()
+        self._pending_callbacks = set()
+        self._audio_ring = AudioRing()
+        self._remote_audio_tasks = []
         self.input_device_id = None
         self.output_device_id = None
+        self._vad = None
+        self._apm = None
+        self._vad_frames = None
+        self._vad_thread = None
+        self._closing = False
+        self._backoff_delay = _RECONNECT_BASE_DELAY
+        self._reconnect_task = None
+        self._event_queue = asyncio.Queue()
+        self._event_task = None
+        self._loop = None
     
     async def initialize(self) -> bool:
         """
@@ -93,15 +531,26 @@ class VoiceService:
             True if initialization was successful, False otherwise
         """
         try:
-            # Create LiveKit room instance
-            self.room = self._create_room(self.options)
+            # Remote audio arriving on other threads is handed to this loop
+            self._loop = asyncio.get_running_loop()
+            
+            # Reuse a live room for the same URL and token, or create one
+            entry = await self._get_room(self.options)
+            if self.room is not entry.room:
+                self._remove_event_listeners()
+                self.room = entry.room
             
-            # Set up event listeners
-            self._setup_event_listeners()
+            # Listeners are registered once per room; a service initialized
+            # with the same token takes the room over from the previous owner
+            if entry.owner is not self:
+                if entry.owner is not None:
+                    entry.owner._release_room()
+                entry.owner = self
+                self._setup_event_listeners()
             
             return True
         except Exception as e:
-            logger.error(f"LiveKit initialization error: {str(e)}")
+            logger.error("LiveKit initialization error: %s", e)
             self.connection_state = ConnectionState.ERROR
             self._notify_state_change()
             return False
@@ -118,24 +567,28 @@ class VoiceService:
             return False
             
         try:
+            self._closing = False
+            self._start_event_pump()
             self.connection_state = ConnectionState.CONNECTING
             self._notify_state_change()
             
-            # Connect to LiveKit room
-            await self.room.connect(
-                self.options.url,
-                self.options.token,
-                {
-                    "auto_subscribe": self.options.auto_subscribe
-                }
-            )
+            # Connect to LiveKit room; a room reused from the cache may still be connected
+            if not self.room.isconnected():
+                await self.room.connect(
+                    self.options.url,
+                    self.options.token,
+                    {
+                        "auto_subscribe": self.options.auto_subscribe
+                    }
+                )
             
             self.connection_state = ConnectionState.CONNECTED
+            self._backoff_delay = _RECONNECT_BASE_DELAY
             self._notify_state_change()
             
             return True
         except Exception as e:
-            logger.error(f"LiveKit connection error: {str(e)}")
+            logger.error("LiveKit connection error: %s", e)
             self.connection_state = ConnectionState.ERROR
             self._notify_state_change()
             return False
@@ -150,14 +603,29 @@ class VoiceService:
         if not self.room:
             return True
             
+        # A requested disconnect must not trigger the reconnect loop
+        self._closing = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+            
+        # An explicitly closed room is never handed out again
+        key = _room_key(self.options)
+        entry = _ROOM_CACHE.get(key)
+        if entry is not None and entry.room is self.room:
+            del _ROOM_CACHE[key]
+            
         try:
             await self.room.disconnect()
             self.connection_state = ConnectionState.DISCONNECTED
             self._notify_state_change()
             return True
         except Exception as e:
-            logger.error(f"LiveKit disconnection error: {str(e)}")
+            logger.error("LiveKit disconnection error: %s", e)
             return False
+        finally:
+            # Events from the closed room are not applied
+            self._stop_event_pump()
     
     async def start_audio_capture(self, device_id: Optional[str] = None) -> bool:
         """
@@ -177,16 +645,35 @@ class VoiceService:
             # Store selected device ID
             self.input_device_id = device_id
             
-            # Create audio capture options
-            options = {
-                "echo_cancellation": self.options.enable_echo_cancellation,
-                "noise_suppression": self.options.enable_noise_suppression,
-                "auto_gain_control": self.options.enable_auto_gain_control
-            }
+            # Create audio capture options; headless agents bypass the
+            # track's processing and feed frames through the native APM
+            if HEADLESS_MODE:
+                self._apm = NativeApm(
+                    echo_cancellation=self.options.enable_echo_cancellation,
+                    noise_suppression=self.options.enable_noise_suppression,
+                    auto_gain_control=self.options.enable_auto_gain_control
+                )
+                options = {
+                    "echo_cancellation": False,
+                    "noise_suppression": False,
+                    "auto_gain_control": False
+                }
+            else:
+                options = {
+                    "echo_cancellation": self.options.enable_echo_cancellation,
+                    "noise_suppression": self.options.enable_noise_suppression,
+                    "auto_gain_control": self.options.enable_auto_gain_control
+                }
             
             if device_id:
                 options["device_id"] = device_id
                 
+            # Load the VAD model before publishing anything, so a missing
+            # runtime or model fails without leaving a track behind. The
+            # ONNX session is loaded once and reused across captures
+            if self._vad is None:
+                self._vad = SileroVadEngine(input_rate=APM_SAMPLE_RATE)
+                
             # Create local audio track
             self.local_track = await self.room.create_local_audio_track(options)
             
@@ -198,9 +685,28 @@ class VoiceService:
             
             return True
         except Exception as e:
-            logger.error(f"Audio capture error: {str(e)}")
+            logger.error("Audio capture error: %s", e)
+            await self._discard_local_track()
             return False
     
+    async def _discard_local_track(self) -> None:
+        """
+        Stop and unpublish a local track left behind by a failed capture start
+        """
+        self._apm = None
+        if not self.local_track:
+            return
+            
+        track, self.local_track = self.local_track, None
+        results = await asyncio.gather(
+            track.stop(),
+            self.room.unpublish_tracks([track]),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Audio capture cleanup error: %s", result)
+    
     async def stop_audio_capture(self) -> bool:
         """
         Stop capturing audio from the microphone
@@ -213,18 +719,43 @@ class VoiceService:
             
         try:
             # Stop voice activity detection
-            self._stop_voice_activity_detection()
-            
-            # Stop and unpublish local track
-            await self.local_track.stop()
+            await self._stop_voice_activity_detection()
             
+            # Stop and unpublish local track concurrently
+            pending = [self.local_track.stop()]
             if self.room:
-                await self.room.unpublish_tracks([self.local_track])
+                pending.append(self.room.unpublish_tracks([self.local_track]))
+            results = await asyncio.gather(*pending, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Stop audio capture error: %s", result)
                 
             self.local_track = None
+            self._apm = None
             return True
         except Exception as e:
-            logger.error(f"Stop audio capture error: {str(e)}")
+            logger.error("Stop audio capture error: %s", e)
+            return False
+    
+    async def push_audio_frame(self, frame: bytes) -> bool:
+        """
+        Send a frame of agent audio on the local track in headless mode,
+        running it through the native APM first
+        
+        Args:
+            frame: 10 ms of 48 kHz mono int16 PCM
+            
+        Returns:
+            True if the frame was sent, False otherwise
+        """
+        if not self.local_track or not self._apm:
+            return False
+            
+        try:
+            await self.local_track.capture_frame(self._apm.process_stream(frame))
+            return True
+        except Exception as e:
+            logger.error("Push audio frame error: %s", e)
             return False
     
     async def mute(self) -> bool:
@@ -242,7 +773,7 @@ class VoiceService:
             self.is_muted = True
             return True
         except Exception as e:
-            logger.error(f"Mute error: {str(e)}")
+            logger.error("Mute error: %s", e)
             return False
     
     async def unmute(self) -> bool:
@@ -260,7 +791,7 @@ class VoiceService:
             self.is_muted = False
             return True
         except Exception as e:
-            logger.error(f"Unmute error: {str(e)}")
+            logger.error("Unmute error: %s", e)
             return False
     
     async def set_audio_quality(self, quality: AudioQuality) -> bool:
@@ -283,7 +814,7 @@ class VoiceService:
                 
             return True
         except Exception as e:
-            logger.error(f"Set audio quality error: {str(e)}")
+            logger.error("Set audio quality error: %s", e)
             return False
     
     async def set_output_device(self, device_id: str) -> bool:
@@ -299,13 +830,19 @@ class VoiceService:
         try:
             self.output_device_id = device_id
             
-            # Set output device for all remote tracks
-            for track in self.remote_tracks.values():
-                await track.set_output_device(device_id)
+            # Set output device for all remote tracks concurrently; one
+            # failing track should not stop the others
+            results = await asyncio.gather(
+                *(track.set_output_device(device_id) for track in self.remote_tracks.values()),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error("Set output device error: %s", result)
                 
             return True
         except Exception as e:
-            logger.error(f"Set output device error: {str(e)}")
+            logger.error("Set output device error: %s", e)
             return False
     
     async def get_input_devices(self) -> List[AudioDevice]:
@@ -319,7 +856,7 @@ class VoiceService:
             devices = await self._get_media_devices("audioinput")
             return devices
         except Exception as e:
-            logger.error(f"Get input devices error: {str(e)}")
+            logger.error("Get input devices error: %s", e)
             return []
     
     async def get_output_devices(self) -> List[AudioDevice]:
@@ -333,35 +870,107 @@ class VoiceService:
             devices = await self._get_media_devices("audiooutput")
             return devices
         except Exception as e:
-            logger.error(f"Get output devices error: {str(e)}")
+            logger.error("Get output devices error: %s", e)
             return []
     
-    def on_state_change(self, callback: Callable[[ConnectionState], None]) -> None:
+    def on_state_change(self, callback: Callable[[ConnectionState], Any]) -> None:
         """
         Register a callback for connection state changes
         
         Args:
-            callback: Function to call when state changes
+            callback: Function or coroutine function to call when state changes
         """
-        self.on_state_change_callbacks.append(callback)
+        if inspect.iscoroutinefunction(callback):
+            self._async_state_callbacks += (callback,)
+        else:
+            self._sync_state_callbacks += (callback,)
     
-    def on_voice_activity(self, callback: Callable[[VoiceActivityState], None]) -> None:
+    def on_voice_activity(self, callback: Callable[[VoiceActivityState], Any]) -> None:
         """
         Register a callback for voice activity changes
         
         Args:
-            callback: Function to call when voice activity changes
+            callback: Function or coroutine function to call when voice activity changes
+        """
+        if inspect.iscoroutinefunction(callback):
+            self._async_voice_activity_callbacks += (callback,)
+        else:
+            self._sync_voice_activity_callbacks += (callback,)
+    
+    def on_remote_audio(self, callback: Callable[[memoryview], None]) -> None:
+        """
+        Register a callback for remote audio data; must be called from the
+        event loop
+        
+        Each callback runs in its own task reading the remote audio ring, so a
+        slow callback drops its oldest frames instead of delaying the others
+        
+        Args:
+            callback: Function to call when remote audio is received; the frame
+                is a view into the ring and must not be kept after it returns
         """
-        self.on_voice_activity_callbacks.append(callback)
+        task = asyncio.get_running_loop().create_task(self._forward_remote_audio(callback))
+        self._remote_audio_tasks.append(task)
     
-    def on_remote_audio(self, callback: Callable[[bytes], None]) -> None:
+    def register_consumer(self) -> AsyncIterator[memoryview]:
         """
-        Register a callback for remote audio data
+        Subscribe to remote audio
+        
+        Returns:
+            Async iterator over remote audio frames received from now on, as
+            views that are only valid until the consumer next awaits
+        """
+        return self._audio_ring.consume()
+    
+    async def _forward_remote_audio(self, callback: Callable[[memoryview], None]) -> None:
+        """
+        Feed remote audio from the ring to a registered callback
         
         Args:
-            callback: Function to call when remote audio is received
+            callback: Function to call with each frame
         """
-        self.on_remote_audio_callbacks.append(callback)
+        async for data in self._audio_ring.consume():
+            try:
+                callback(data)
+            except Exception as e:
+                logger.error("Remote audio callback error: %s", e)
+    
+    async def _get_room(self, options: LiveKitOptions) -> _RoomEntry:
+        """
+        Get the cached room for the options' URL and token, creating it if
+        there is none or it has expired
+        
+        Rooms still connected for their owner never expire. Expired rooms
+        are evicted and disconnected
+        
+        Args:
+            options: LiveKit connection options
+            
+        Returns:
+            Cache entry holding the room
+        """
+        key = _room_key(options)
+        now = time.monotonic()
+        
+        # Update the cache before awaiting, so concurrent initializations
+        # see the same entry and never pick up an evicted room
+        expired = [
+            k for k, entry in _ROOM_CACHE.items()
+            if entry.expires <= now and not _room_in_use(entry)
+        ]
+        evicted = [_ROOM_CACHE.pop(k) for k in expired]
+        
+        entry = _ROOM_CACHE.get(key)
+        if entry is None:
+            entry = _ROOM_CACHE[key] = _RoomEntry(self._create_room(options), 0.0)
+        entry.expires = now + _ROOM_TTL
+        
+        for stale in evicted:
+            if stale.owner is not None:
+                stale.owner._release_room()
+        await _disconnect_rooms([stale.room for stale in evicted])
+        
+        return entry
     
     def _create_room(self, options: LiveKitOptions) -> Any:
         """
@@ -384,44 +993,134 @@ class VoiceService:
         if not self.room:
             return
             
-        # Set up event listeners for connection state changes
-        self.room.on("connected", self._handle_connected)
-        self.room.on("disconnected", self._handle_disconnected)
-        self.room.on("reconnecting", self._handle_reconnecting)
-        self.room.on("reconnected", self._handle_reconnected)
-        self.room.on("error", self._handle_error)
+        self._room_listeners = [
+            # Connection state changes
+            ("connected", self._queue_event(self._handle_connected)),
+            ("disconnected", self._queue_event(self._handle_disconnected)),
+            ("reconnecting", self._queue_event(self._handle_reconnecting)),
+            ("reconnected", self._queue_event(self._handle_reconnected)),
+            ("error", self._queue_event(self._handle_error)),
+            # Tracks
+            ("track_subscribed", self._queue_event(self._handle_track_subscribed)),
+            ("track_unsubscribed", self._queue_event(self._handle_track_unsubscribed))
+        ]
+        for event, listener in self._room_listeners:
+            self.room.on(event, listener)
+        
+        self._start_event_pump()
+    
+    def _start_event_pump(self) -> None:
+        """
+        Start the single consumer that applies room events in order
+        """
+        if not self._event_task or self._event_task.done():
+            self._event_task = asyncio.get_running_loop().create_task(self._event_pump())
+    
+    def _stop_event_pump(self) -> None:
+        """
+        Cancel the event consumer and drop the events it has not applied
+        """
+        if self._event_task:
+            self._event_task.cancel()
+            self._event_task = None
+        self._event_queue = asyncio.Queue()
+    
+    def _remove_event_listeners(self) -> None:
+        """
+        Remove this service's event listeners from its room
+        """
+        for event, listener in self._room_listeners:
+            self.room.off(event, listener)
+        self._room_listeners = []
+    
+    def _release_room(self) -> None:
+        """
+        Detach from a room that was evicted or taken over by another service
+        """
+        if not self.room:
+            return
+            
+        self._closing = True
+        if self._reconnect_task:
+            self._reconnect_task.cancel()
+            self._reconnect_task = None
+            
+        self._remove_event_listeners()
+        self._stop_event_pump()
+        self.room = None
+        self.connection_state = ConnectionState.DISCONNECTED
+        self._notify_state_change()
+    
+    def _queue_event(self, handler: Callable[..., None]) -> Callable[..., None]:
+        """
+        Wrap an event handler so the room event is queued for _event_pump
+        
+        Args:
+            handler: Handler to run when the event is applied
+            
+        Returns:
+            Listener to register with the room
+        """
+        def enqueue(*args: Any) -> None:
+            self._event_queue.put_nowait((handler, args))
+        return enqueue
+    
+    async def _event_pump(self) -> None:
+        """
+        Apply queued room events, notifying state callbacks once per burst
+        """
+        while True:
+            handler, args = await self._event_queue.get()
+            self._apply_event(handler, args)
+            
+            # Apply the rest of the burst before notifying
+            while not self._event_queue.empty():
+                handler, args = self._event_queue.get_nowait()
+                self._apply_event(handler, args)
+                
+            self._notify_state_change()
+    
+    def _apply_event(self, handler: Callable[..., None], args: Tuple[Any, ...]) -> None:
+        """
+        Run one event handler, logging instead of stopping the pump on failure
         
-        # Set up event listeners for tracks
-        self.room.on("track_subscribed", self._handle_track_subscribed)
-        self.room.on("track_unsubscribed", self._handle_track_unsubscribed)
+        Args:
+            handler: Event handler
+            args: Event arguments
+        """
+        try:
+            handler(*args)
+        except Exception as e:
+            logger.error("LiveKit event handler error: %s", e)
     
     def _handle_connected(self) -> None:
         """
         Handle room connected event
         """
         self.connection_state = ConnectionState.CONNECTED
-        self._notify_state_change()
+        self._backoff_delay = _RECONNECT_BASE_DELAY
     
     def _handle_disconnected(self) -> None:
         """
         Handle room disconnected event
         """
         self.connection_state = ConnectionState.DISCONNECTED
-        self._notify_state_change()
+        
+        # Reconnect unless the disconnect was requested
+        if not self._closing:
+            self._schedule_reconnect()
     
     def _handle_reconnecting(self) -> None:
         """
         Handle room reconnecting event
         """
         self.connection_state = ConnectionState.RECONNECTING
-        self._notify_state_change()
     
     def _handle_reconnected(self) -> None:
         """
         Handle room reconnected event
         """
         self.connection_state = ConnectionState.CONNECTED
-        self._notify_state_change()
     
     def _handle_error(self, error: Any) -> None:
         """
@@ -430,9 +1129,58 @@ class VoiceService:
         Args:
             error: Error object from LiveKit
         """
-        logger.error(f"LiveKit room error: {str(error)}")
+        logger.error("LiveKit room error: %s", error)
+        
+        # Transient network errors keep the room cached for reconnects
+        fatal = _is_fatal_error(error)
+        if fatal:
+            key = _room_key(self.options)
+            entry = _ROOM_CACHE.get(key)
+            if entry is not None and entry.room is self.room:
+                del _ROOM_CACHE[key]
+            
         self.connection_state = ConnectionState.ERROR
-        self._notify_state_change()
+        
+        if not fatal:
+            self._schedule_reconnect()
+    
+    def _schedule_reconnect(self) -> None:
+        """
+        Start the reconnect loop unless one is already running
+        """
+        if self._reconnect_task and not self._reconnect_task.done():
+            return
+            
+        self._reconnect_task = asyncio.get_running_loop().create_task(self._reconnect_with_backoff())
+    
+    async def _reconnect_with_backoff(
+        self,
+        max_tries: int = _RECONNECT_MAX_TRIES,
+        base: float = _RECONNECT_BASE_DELAY,
+        cap: float = _RECONNECT_MAX_DELAY
+    ) -> bool:
+        """
+        Reconnect to the room with decorrelated jitter backoff
+        
+        Args:
+            max_tries: Maximum number of connection attempts
+            base: Minimum delay in seconds
+            cap: Maximum delay in seconds
+            
+        Returns:
+            True if the connection was re-established, False otherwise
+        """
+        for _ in range(max_tries):
+            self._backoff_delay = min(cap, random.uniform(base, self._backoff_delay * 3))
+            await asyncio.sleep(self._backoff_delay)
+            
+            if self._closing:
+                return False
+            if await self.connect():
+                return True
+                
+        logger.error("LiveKit reconnect failed after %d attempts", max_tries)
+        return False
     
     def _handle_track_subscribed(self, track: Any, publication: Any, participant: Any) -> None:
         """
@@ -468,14 +1216,28 @@ class VoiceService:
     
     def _handle_remote_audio_data(self, data: bytes) -> None:
         """
-        Handle remote audio data
+        Handle remote audio data, which may arrive on a network thread
         
         Args:
             data: Audio data bytes
         """
-        # Notify all registered callbacks
-        for callback in self.on_remote_audio_callbacks:
-            callback(data)
+        # The ring and the APM belong to the event loop thread. The frame is
+        # copied since the sender may reuse its buffer
+        self._loop.call_soon_threadsafe(self._publish_remote_audio, bytes(data))
+    
+    def _publish_remote_audio(self, data: bytes) -> None:
+        """
+        Publish remote audio on the event loop thread
+        
+        Args:
+            data: Audio data bytes
+        """
+        # Publish to the ring; consumers read at their own pace
+        self._audio_ring.publish(data)
+        
+        # Remote audio is the echo reference for headless capture
+        if self._apm:
+            self._apm.process_reverse_stream(data)
     
     def _start_voice_activity_detection(self) -> None:
         """
@@ -483,11 +1245,24 @@ class VoiceService:
         """
         if not self.local_track:
             return
-            
-        # Set up voice activity detection
-        self.local_track.on("voice_activity", self._handle_voice_activity)
+        
+        self._vad.reset()
+        
+        # Inference runs on a dedicated thread; activity changes are posted
+        # back to the event loop
+        self._vad_frames = queue.SimpleQueue()
+        self._vad_thread = threading.Thread(
+            target=self._run_voice_activity_detection,
+            args=(asyncio.get_running_loop(), self._vad_frames),
+            name="silero-vad",
+            daemon=True
+        )
+        self._vad_thread.start()
+        
+        # Feed raw PCM from the local track to the model
+        self.local_track.on("audio_frame", self._handle_local_audio_frame)
     
-    def _stop_voice_activity_detection(self) -> None:
+    async def _stop_voice_activity_detection(self) -> None:
         """
         Stop voice activity detection on the local track
         """
@@ -495,7 +1270,41 @@ class VoiceService:
             return
             
         # Remove voice activity detection
-        self.local_track.off("voice_activity", self._handle_voice_activity)
+        self.local_track.off("audio_frame", self._handle_local_audio_frame)
+        
+        # Wait for the thread to exit, so a restarted capture never resets the
+        # engine while the old thread is still running it
+        if self._vad_thread:
+            self._vad_frames.put(None)
+            await asyncio.to_thread(self._vad_thread.join)
+            self._vad_frames = None
+            self._vad_thread = None
+    
+    def _handle_local_audio_frame(self, data: bytes) -> None:
+        """
+        Hand a local PCM frame to the voice activity detection thread
+        
+        Args:
+            data: 48 kHz mono int16 PCM
+        """
+        if self._vad_frames:
+            self._vad_frames.put(data)
+    
+    def _run_voice_activity_detection(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        frames: queue.SimpleQueue
+    ) -> None:
+        """
+        Run the VAD model over queued frames until a None sentinel arrives
+        
+        Args:
+            loop: Event loop to post activity changes to
+            frames: Queue of PCM frames from the local track
+        """
+        while (pcm := frames.get()) is not None:
+            for is_active in self._vad.process(pcm):
+                loop.call_soon_threadsafe(self._handle_voice_activity, is_active)
     
     def _handle_voice_activity(self, is_active: bool) -> None:
         """
@@ -510,15 +1319,53 @@ class VoiceService:
             self.voice_activity_state = new_state
             
             # Notify all registered callbacks
-            for callback in self.on_voice_activity_callbacks:
+            for callback in self._sync_voice_activity_callbacks:
                 callback(new_state)
+            if self._async_voice_activity_callbacks:
+                self._run_async_callbacks(self._async_voice_activity_callbacks, new_state)
     
     def _notify_state_change(self) -> None:
         """
-        Notify all registered callbacks of connection state change
+        Notify all registered callbacks of connection state change, unless
+        they were already told about the current state
+        """
+        state = self.connection_state
+        if state == self._last_notified_state:
+            return
+        self._last_notified_state = state
+        
+        for callback in self._sync_state_callbacks:
+            callback(state)
+        if self._async_state_callbacks:
+            self._run_async_callbacks(self._async_state_callbacks, state)
+    
+    def _run_async_callbacks(self, callbacks: Tuple[Callable[[Any], Any], ...], value: Any) -> None:
+        """
+        Run async callbacks concurrently without blocking the caller
+        
+        Args:
+            callbacks: Coroutine functions to call
+            value: Value to pass to each callback
         """
-        for callback in self.on_state_change_callbacks:
-            callback(self.connection_state)
+        # Keep a reference until done so the gathered tasks aren't collected
+        future = asyncio.gather(*(callback(value) for callback in callbacks), return_exceptions=True)
+        self._pending_callbacks.add(future)
+        future.add_done_callback(self._pending_callbacks.discard)
+        future.add_done_callback(self._log_callback_errors)
+    
+    @staticmethod
+    def _log_callback_errors(future: asyncio.Future) -> None:
+        """
+        Log the exceptions raised by gathered async callbacks
+        
+        Args:
+            future: Gather future of callback results
+        """
+        if future.cancelled():
+            return
+        for result in future.result():
+            if isinstance(result, Exception):
+                logger.error("Callback error: %s", result)
     
     async def _get_media_devices(self, kind: str) -> List[AudioDevice]:
         """
@@ -557,16 +1404,8 @@ class VoiceService:
         Returns:
             Bitrate in kbps
         """
-        if quality == AudioQuality.LOW:
-            return 32000
-        elif quality == AudioQuality.MEDIUM:
-            return 64000
-        elif quality == AudioQuality.HIGH:
-            return 128000
-        elif quality == AudioQuality.ULTRA:
-            return 256000
-        else:
-            return 64000  # Default to MEDIUM
+        # Default to MEDIUM
+        return _BITRATE_BY_QUALITY.get(quality, 64000)
 
 
 # Factory function to create voice service
@@ -350,12 +350,9 @@ class AdminService:
             if category:
                 query = query.eq("category", category.value)
                 
-            # Get total count
-            count_response = query.execute()
-            total = count_response.count
-            
-            # Get paginated results
+            # Fetch the page and the exact total in a single request
             response = query.order("name").range(offset, offset + page_size - 1).execute()
+            total = response.count or 0
             
             prompts = []
             for prompt_data in response.data:
@@ -441,35 +438,18 @@ class AdminService:
             raise PermissionError("Only admin users can set default system prompts")
             
         try:
-            # Get all prompts to find the current default in the same category
-            prompts = await self.get_all_system_prompts()
-            
-            # Find the prompt we want to set as default
-            target_prompt = None
-            current_default_id = None
-            
-            for prompt in prompts:
-                if prompt.id == prompt_id:
-                    target_prompt = prompt
+            # Move the category's default to this prompt in a single statement
+            response = self.supabase.rpc(
+                "set_default_prompt",
+                {
+                    "p_prompt_id": prompt_id
+                }
+            ).execute()
             
-            if not target_prompt:
+            # The function returns no rows when the prompt does not exist
+            if not response.data or not response.data[0].get("id"):
                 logger.error(f"System prompt not found: {prompt_id}")
                 return False
-                
-            # Find the current default in the same category
-            for prompt in prompts:
-                if prompt.is_default and prompt.category == target_prompt.category and prompt.id != prompt_id:
-                    current_default_id = prompt.id
-                    break
-                
-            # Use the table instance created in __init__
-            
-            # First, unset the current default if there is one
-            if current_default_id:
-                await self.system_prompts_table.update(current_default_id, {"is_default": False})
-            
-            # Then set the new default
-            await self.system_prompts_table.update(prompt_id, {"is_default": True})
             
             return True
             
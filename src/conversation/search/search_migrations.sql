@@ -147,4 +147,92 @@ BEGIN
   LIMIT limit_val
   OFFSET offset_val;
 END;
-$$ LANGUAGE plpgsql;
\ No newline at end of file
+$$ LANGUAGE plpgsql;
+
+-- Enable trigram matching for substring searches
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Create trigram GIN index so ILIKE '%...%' on turn content uses an index scan
+CREATE INDEX IF NOT EXISTS idx_conversation_turns_content_trgm ON conversation_turns USING GIN (content gin_trgm_ops);
+
+-- Create a function to find a user's conversations by turn content
+-- Returns one row per conversation ranked by its best-matching turn, with a snippet of
+-- that turn. Word queries match through the GIN-indexed search_vector; queries shorter
+-- than 3 characters or containing punctuation (partial words, IDs) fall back to a
+-- substring match ranked by similarity. The trigram index serves patterns of 3 or more
+-- characters; shorter ones have no trigrams and scan the user's turns. Ties in relevance
+-- are ordered by conversation_id so OFFSET pages neither repeat nor skip conversations
+CREATE OR REPLACE FUNCTION search_user_conversation_turns(
+  search_query TEXT,
+  user_id_param UUID,
+  limit_param INTEGER DEFAULT 10,
+  offset_param INTEGER DEFAULT 0
+)
+RETURNS TABLE (
+  conversation_id UUID,
+  relevance REAL,
+  snippet TEXT
+) AS $$
+#variable_conflict use_column
+DECLARE
+  like_pattern TEXT;
+BEGIN
+  IF length(search_query) < 3 OR search_query ~ '[^[:alnum:][:space:]]' THEN
+    like_pattern := '%' || replace(replace(replace(search_query, '\', '\\'), '%', '\%'), '_', '\_') || '%';
+
+    RETURN QUERY
+    WITH best_matches AS (
+      SELECT DISTINCT ON (t.conversation_id)
+        t.conversation_id,
+        t.content,
+        similarity(t.content, search_query) AS relevance
+      FROM
+        conversation_turns t
+        JOIN conversations c ON c.id = t.conversation_id
+      WHERE
+        t.content ILIKE like_pattern
+        AND c.user_id = user_id_param
+      ORDER BY t.conversation_id, relevance DESC
+    )
+    SELECT
+      m.conversation_id,
+      m.relevance,
+      substr(m.content, greatest(strpos(lower(m.content), lower(search_query)) - 40, 1), 120) AS snippet
+    FROM best_matches m
+    ORDER BY m.relevance DESC, m.conversation_id
+    LIMIT limit_param
+    OFFSET offset_param;
+  ELSE
+    RETURN QUERY
+    WITH q AS (
+      SELECT plainto_tsquery('english', search_query) AS query
+    ),
+    best_matches AS (
+      SELECT DISTINCT ON (t.conversation_id)
+        t.conversation_id,
+        t.content,
+        ts_rank(t.search_vector, q.query) AS relevance
+      FROM
+        conversation_turns t
+        JOIN conversations c ON c.id = t.conversation_id,
+        q
+      WHERE
+        t.search_vector @@ q.query
+        AND c.user_id = user_id_param
+      ORDER BY t.conversation_id, relevance DESC
+    ),
+    page AS (
+      SELECT * FROM best_matches
+      ORDER BY relevance DESC, conversation_id
+      LIMIT limit_param
+      OFFSET offset_param
+    )
+    SELECT
+      page.conversation_id,
+      page.relevance,
+      ts_headline('english', page.content, q.query) AS snippet
+    FROM page, q
+    ORDER BY page.relevance DESC, page.conversation_id;
+  END IF;
+END;
+$$ LANGUAGE plpgsql STABLE;
@@ -0,0 +1,32 @@
+-- Migration: Register User Profile
+-- Description: Creates the profile and default settings rows for a new user in a single transaction
+
+-- Create register_user_profile function
+CREATE OR REPLACE FUNCTION register_user_profile(uid UUID, email TEXT, full_name TEXT)
+RETURNS users
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    new_user users;
+BEGIN
+    IF uid IS DISTINCT FROM auth.uid() THEN
+        RAISE EXCEPTION 'register_user_profile: uid does not match the authenticated user'
+            USING ERRCODE = '42501';
+    END IF;
+
+    INSERT INTO users (id, email, full_name, avatar_url, role)
+    VALUES (uid, email, full_name, NULL, 'user')
+    RETURNING * INTO new_user;
+
+    INSERT INTO user_settings (user_id, theme, language)
+    VALUES (uid, 'light', 'en-US');
+
+    RETURN new_user;
+END;
+$$;
+
+-- Only signed-in users may register their own profile
+REVOKE EXECUTE ON FUNCTION register_user_profile(UUID, TEXT, TEXT) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION register_user_profile(UUID, TEXT, TEXT) TO authenticated;
@@ -0,0 +1,6 @@
+-- Migration: Conversation List Index
+-- Description: Supports keyset pagination of a user's conversations ordered by last update
+
+-- Create composite index matching the list ordering (updated_at, id tiebreaker)
+CREATE INDEX IF NOT EXISTS idx_conversations_user_updated
+ON conversations(user_id, is_archived, updated_at DESC, id DESC);
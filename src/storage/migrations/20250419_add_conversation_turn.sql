@@ -0,0 +1,33 @@
+-- Migration: Add Conversation Turn
+-- Description: Records a turn, its optional audio file and the conversation's updated_at in one transaction
+
+-- Create add_conversation_turn function
+CREATE OR REPLACE FUNCTION add_conversation_turn(
+    p_turn_id UUID,
+    p_conv_id UUID,
+    p_role TEXT,
+    p_content TEXT,
+    p_audio_url TEXT DEFAULT NULL,
+    p_audio_path TEXT DEFAULT NULL,
+    p_audio_duration FLOAT DEFAULT NULL
+)
+RETURNS conversation_turns
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_turn conversation_turns;
+BEGIN
+    INSERT INTO conversation_turns (id, conversation_id, role, content, audio_url)
+    VALUES (p_turn_id, p_conv_id, p_role, p_content, p_audio_url)
+    RETURNING * INTO new_turn;
+
+    IF p_audio_path IS NOT NULL THEN
+        INSERT INTO audio_files (turn_id, file_path, duration)
+        VALUES (p_turn_id, p_audio_path, p_audio_duration);
+    END IF;
+
+    UPDATE conversations SET updated_at = NOW() WHERE id = p_conv_id;
+
+    RETURN new_turn;
+END;
+$$;
@@ -0,0 +1,21 @@
+-- Migration: Get Conversation With Turns
+-- Description: Returns a user's conversation and its ordered turns as one JSON document
+
+-- Create get_conversation_with_turns function
+CREATE OR REPLACE FUNCTION get_conversation_with_turns(p_conv_id UUID, p_user_id UUID)
+RETURNS JSONB
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT jsonb_build_object(
+        'conv', to_jsonb(c),
+        'turns', COALESCE(
+            (SELECT jsonb_agg(to_jsonb(t) ORDER BY t.created_at)
+             FROM conversation_turns t
+             WHERE t.conversation_id = c.id),
+            '[]'::jsonb
+        )
+    )
+    FROM conversations c
+    WHERE c.id = p_conv_id AND c.user_id = p_user_id;
+$$;
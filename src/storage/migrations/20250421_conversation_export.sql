@@ -0,0 +1,75 @@
+-- Migration: Conversation Export
+-- Description: Builds conversation exports in the database so clients receive the finished document
+
+-- Create export_timestamp function; formats a timestamp in UTC the way
+-- Python's datetime.isoformat() does, fractional seconds only when non-zero
+CREATE OR REPLACE FUNCTION export_timestamp(ts TIMESTAMP WITH TIME ZONE)
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT to_char(ts AT TIME ZONE 'UTC', 'YYYY-MM-DD"T"HH24:MI:SS')
+        || CASE WHEN date_part('microseconds', ts)::INT % 1000000 <> 0
+                THEN to_char(ts AT TIME ZONE 'UTC', '.US')
+                ELSE '' END
+        || '+00:00';
+$$;
+
+-- Create export_conversation_text function; the date is in UTC whatever the
+-- session time zone
+CREATE OR REPLACE FUNCTION export_conversation_text(p_id UUID, p_user UUID)
+RETURNS TEXT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT
+        '# ' || c.title || E'\n' ||
+        'Date: ' || to_char(c.created_at AT TIME ZONE 'UTC', 'YYYY-MM-DD HH24:MI') || E'\n\n' ||
+        COALESCE(
+            (SELECT string_agg(
+                 CASE t.role WHEN 'user' THEN 'User: ' ELSE 'Assistant: ' END || t.content || E'\n\n',
+                 '' ORDER BY t.created_at)
+             FROM conversation_turns t
+             WHERE t.conversation_id = c.id),
+            ''
+        )
+    FROM conversations c
+    WHERE c.id = p_id AND c.user_id = p_user;
+$$;
+
+-- Create export_conversation_json function; keys keep the order of the
+-- original Python export, and timestamps match its isoformat() output
+CREATE OR REPLACE FUNCTION export_conversation_json(p_id UUID, p_user UUID)
+RETURNS JSON
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT json_build_object(
+        'id', c.id,
+        'title', c.title,
+        'created_at', export_timestamp(c.created_at),
+        'updated_at', export_timestamp(c.updated_at),
+        'turns', COALESCE(
+            (SELECT json_agg(
+                 json_build_object('role', t.role, 'content', t.content, 'created_at', export_timestamp(t.created_at))
+                 ORDER BY t.created_at)
+             FROM conversation_turns t
+             WHERE t.conversation_id = c.id),
+            '[]'::json
+        )
+    )
+    FROM conversations c
+    WHERE c.id = p_id AND c.user_id = p_user;
+$$;
+
+-- Create export_conversation_audio_urls function
+CREATE OR REPLACE FUNCTION export_conversation_audio_urls(p_id UUID, p_user UUID)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT array_agg(t.audio_url ORDER BY t.created_at)
+    FROM conversation_turns t
+    JOIN conversations c ON c.id = t.conversation_id
+    WHERE c.id = p_id AND c.user_id = p_user AND t.audio_url IS NOT NULL;
+$$;
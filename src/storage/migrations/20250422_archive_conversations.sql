@@ -0,0 +1,13 @@
+-- Migration: Archive Conversations
+-- Description: Soft deletes a batch of a user's conversations with one set-based update
+
+-- Create archive_conversations function
+CREATE OR REPLACE FUNCTION archive_conversations(p_ids UUID[], p_user UUID)
+RETURNS SETOF UUID
+LANGUAGE sql
+AS $$
+    UPDATE conversations
+    SET is_archived = TRUE
+    WHERE user_id = p_user AND id = ANY(p_ids)
+    RETURNING id;
+$$;
@@ -0,0 +1,92 @@
+-- Migration: Conversation Exports Cache
+-- Description: Stores built exports so unchanged conversations are not re-exported
+
+-- Create conversation_exports table
+CREATE TABLE IF NOT EXISTS conversation_exports (
+    conversation_id UUID NOT NULL REFERENCES conversations(id) ON DELETE CASCADE,
+    format VARCHAR(50) NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL,
+    content TEXT NOT NULL,
+    PRIMARY KEY (conversation_id, format)
+);
+
+-- Exports hold full conversation content, so only the conversation owner may
+-- read or write them
+ALTER TABLE conversation_exports ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view exports of their own conversations"
+  ON conversation_exports
+  FOR SELECT
+  USING (
+    EXISTS (
+      SELECT 1 FROM conversations
+      WHERE conversations.id = conversation_exports.conversation_id
+        AND conversations.user_id = auth.uid()
+    )
+  );
+
+CREATE POLICY "Users can insert exports of their own conversations"
+  ON conversation_exports
+  FOR INSERT
+  WITH CHECK (
+    EXISTS (
+      SELECT 1 FROM conversations
+      WHERE conversations.id = conversation_exports.conversation_id
+        AND conversations.user_id = auth.uid()
+    )
+  );
+
+CREATE POLICY "Users can update exports of their own conversations"
+  ON conversation_exports
+  FOR UPDATE
+  USING (
+    EXISTS (
+      SELECT 1 FROM conversations
+      WHERE conversations.id = conversation_exports.conversation_id
+        AND conversations.user_id = auth.uid()
+    )
+  );
+
+-- Create export_conversation_cached function
+-- Returns the stored export when it was built from the conversation's current
+-- updated_at, otherwise builds it with export_conversation_text/json and stores it
+CREATE OR REPLACE FUNCTION export_conversation_cached(p_id UUID, p_user UUID, p_format TEXT)
+RETURNS TEXT
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    conv_updated_at TIMESTAMP WITH TIME ZONE;
+    export_content TEXT;
+BEGIN
+    SELECT updated_at INTO conv_updated_at
+    FROM conversations
+    WHERE id = p_id AND user_id = p_user;
+
+    IF NOT FOUND THEN
+        RETURN NULL;
+    END IF;
+
+    SELECT content INTO export_content
+    FROM conversation_exports
+    WHERE conversation_id = p_id AND format = p_format AND updated_at = conv_updated_at;
+
+    IF FOUND THEN
+        RETURN export_content;
+    END IF;
+
+    IF p_format = 'text' THEN
+        export_content := export_conversation_text(p_id, p_user);
+    ELSIF p_format = 'json' THEN
+        export_content := export_conversation_json(p_id, p_user)::TEXT;
+    ELSE
+        RETURN NULL;
+    END IF;
+
+    INSERT INTO conversation_exports (conversation_id, format, updated_at, content)
+    VALUES (p_id, p_format, conv_updated_at, export_content)
+    ON CONFLICT (conversation_id, format)
+    DO UPDATE SET updated_at = EXCLUDED.updated_at, content = EXCLUDED.content;
+
+    RETURN export_content;
+END;
+$$;
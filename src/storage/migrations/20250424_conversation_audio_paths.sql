@@ -0,0 +1,15 @@
+-- Migration: Conversation Audio Paths
+-- Description: Lists the storage paths of a conversation's audio files so they can be signed in one request
+
+-- Create export_conversation_audio_paths function
+CREATE OR REPLACE FUNCTION export_conversation_audio_paths(p_id UUID, p_user UUID)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT array_agg(a.file_path ORDER BY t.created_at)
+    FROM audio_files a
+    JOIN conversation_turns t ON t.id = a.turn_id
+    JOIN conversations c ON c.id = t.conversation_id
+    WHERE c.id = p_id AND c.user_id = p_user;
+$$;
@@ -0,0 +1,127 @@
+-- Migration: Partition Conversation Turns
+-- Description: Hash-partitions conversation_turns by conversation_id so per-conversation reads prune to one partition
+
+BEGIN;
+
+-- Create partitioned table with the same columns and defaults
+CREATE TABLE conversation_turns_partitioned (
+    LIKE conversation_turns INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (conversation_id, id),
+    FOREIGN KEY (conversation_id) REFERENCES conversations(id) ON DELETE CASCADE
+) PARTITION BY HASH (conversation_id);
+
+-- Create 16 hash partitions
+DO $$
+BEGIN
+    FOR i IN 0..15 LOOP
+        EXECUTE format(
+            'CREATE TABLE conversation_turns_p%s PARTITION OF conversation_turns_partitioned '
+            'FOR VALUES WITH (MODULUS 16, REMAINDER %s)',
+            i, i
+        );
+    END LOOP;
+END;
+$$;
+
+-- Backfill from the existing table
+INSERT INTO conversation_turns_partitioned
+SELECT * FROM conversation_turns;
+
+-- audio_files.turn_id can no longer reference id alone: the primary key of a
+-- partitioned table must include the partition key, so audio files carry
+-- their conversation id and reference (conversation_id, id) instead
+ALTER TABLE audio_files ADD COLUMN IF NOT EXISTS conversation_id UUID;
+
+UPDATE audio_files a
+SET conversation_id = t.conversation_id
+FROM conversation_turns t
+WHERE t.id = a.turn_id;
+
+ALTER TABLE audio_files ALTER COLUMN conversation_id SET NOT NULL;
+ALTER TABLE audio_files DROP CONSTRAINT IF EXISTS audio_files_turn_id_fkey;
+
+-- add_conversation_turn returns the old table's row type; drop it before the
+-- swap and recreate it against the new table below
+DROP FUNCTION IF EXISTS add_conversation_turn(UUID, UUID, TEXT, TEXT, TEXT, TEXT, FLOAT);
+
+-- Swap the tables
+ALTER TABLE conversation_turns RENAME TO conversation_turns_old;
+ALTER TABLE conversation_turns_partitioned RENAME TO conversation_turns;
+
+ALTER TABLE audio_files
+ADD CONSTRAINT audio_files_conversation_turn_fkey
+FOREIGN KEY (conversation_id, turn_id)
+REFERENCES conversation_turns(conversation_id, id) ON DELETE CASCADE;
+
+-- Recreate indexes (created on every partition)
+CREATE INDEX IF NOT EXISTS idx_conversation_turns_conv_created
+ON conversation_turns(conversation_id, created_at);
+CREATE INDEX IF NOT EXISTS idx_conversation_turns_search_vector_p
+ON conversation_turns USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_conversation_turns_content_trgm_p
+ON conversation_turns USING GIN (content gin_trgm_ops);
+
+-- Recreate search vector trigger
+CREATE TRIGGER trigger_conversation_turns_search_vector
+BEFORE INSERT OR UPDATE ON conversation_turns
+FOR EACH ROW EXECUTE FUNCTION update_conversation_turns_search_vector();
+
+-- Recreate row level security policies
+ALTER TABLE conversation_turns ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Users can view turns for their own conversations"
+  ON conversation_turns
+  FOR SELECT
+  USING (user_has_conversation_access(conversation_id));
+
+CREATE POLICY "Users can insert turns for their own conversations"
+  ON conversation_turns
+  FOR INSERT
+  WITH CHECK (user_has_conversation_access(conversation_id));
+
+CREATE POLICY "Users can update turns for their own conversations"
+  ON conversation_turns
+  FOR UPDATE
+  USING (user_has_conversation_access(conversation_id));
+
+CREATE POLICY "Users can delete turns for their own conversations"
+  ON conversation_turns
+  FOR DELETE
+  USING (user_has_conversation_access(conversation_id));
+
+-- Recreate add_conversation_turn against the partitioned table
+CREATE OR REPLACE FUNCTION add_conversation_turn(
+    p_turn_id UUID,
+    p_conv_id UUID,
+    p_role TEXT,
+    p_content TEXT,
+    p_audio_url TEXT DEFAULT NULL,
+    p_audio_path TEXT DEFAULT NULL,
+    p_audio_duration FLOAT DEFAULT NULL
+)
+RETURNS conversation_turns
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_turn conversation_turns;
+BEGIN
+    INSERT INTO conversation_turns (id, conversation_id, role, content, audio_url)
+    VALUES (p_turn_id, p_conv_id, p_role, p_content, p_audio_url)
+    RETURNING * INTO new_turn;
+
+    IF p_audio_path IS NOT NULL THEN
+        INSERT INTO audio_files (turn_id, conversation_id, file_path, duration)
+        VALUES (p_turn_id, p_conv_id, p_audio_path, p_audio_duration);
+    END IF;
+
+    UPDATE conversations SET updated_at = NOW() WHERE id = p_conv_id;
+
+    RETURN new_turn;
+END;
+$$;
+
+-- No CASCADE: anything still depending on the old table should fail the
+-- migration rather than be dropped silently
+DROP TABLE conversation_turns_old;
+
+COMMIT;
@@ -0,0 +1,57 @@
+-- Migration: Conversation Turn Audio Key
+-- Description: Stores the storage key of a turn's audio instead of a full URL; URLs are signed on demand
+
+-- Add audio_key column and backfill it from the audio file records
+ALTER TABLE conversation_turns ADD COLUMN IF NOT EXISTS audio_key TEXT;
+
+UPDATE conversation_turns t
+SET audio_key = a.file_path
+FROM audio_files a
+WHERE a.turn_id = t.id AND t.audio_key IS NULL;
+
+-- Compress long turn content with lz4 instead of the default pglz
+ALTER TABLE conversation_turns ALTER COLUMN content SET COMPRESSION lz4;
+
+-- Replace add_conversation_turn so it takes the audio key in place of the URL and path
+DROP FUNCTION IF EXISTS add_conversation_turn(UUID, UUID, TEXT, TEXT, TEXT, TEXT, FLOAT);
+
+CREATE OR REPLACE FUNCTION add_conversation_turn(
+    p_turn_id UUID,
+    p_conv_id UUID,
+    p_role TEXT,
+    p_content TEXT,
+    p_audio_key TEXT DEFAULT NULL,
+    p_audio_duration FLOAT DEFAULT NULL
+)
+RETURNS conversation_turns
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    new_turn conversation_turns;
+BEGIN
+    INSERT INTO conversation_turns (id, conversation_id, role, content, audio_key)
+    VALUES (p_turn_id, p_conv_id, p_role, p_content, p_audio_key)
+    RETURNING * INTO new_turn;
+
+    IF p_audio_key IS NOT NULL THEN
+        INSERT INTO audio_files (turn_id, conversation_id, file_path, duration)
+        VALUES (p_turn_id, p_conv_id, p_audio_key, p_audio_duration);
+    END IF;
+
+    UPDATE conversations SET updated_at = NOW() WHERE id = p_conv_id;
+
+    RETURN new_turn;
+END;
+$$;
+
+-- Read audio keys straight from the turns
+CREATE OR REPLACE FUNCTION export_conversation_audio_paths(p_id UUID, p_user UUID)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT array_agg(t.audio_key ORDER BY t.created_at)
+    FROM conversation_turns t
+    JOIN conversations c ON c.id = t.conversation_id
+    WHERE c.id = p_id AND c.user_id = p_user AND t.audio_key IS NOT NULL;
+$$;
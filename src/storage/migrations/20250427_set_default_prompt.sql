@@ -0,0 +1,76 @@
+-- Migration: Set Default Prompt
+-- Description: Makes one prompt the default for its category in a single statement, with at most one default per category enforced by the database
+
+-- Keep only the most recently updated default in each category
+UPDATE system_prompts p
+SET is_default = FALSE
+WHERE p.is_default
+  AND EXISTS (
+      SELECT 1 FROM system_prompts newer
+      WHERE newer.category = p.category
+        AND newer.is_default
+        AND (newer.updated_at, newer.id) > (p.updated_at, p.id)
+  );
+
+-- At most one default per category; deferred so a single statement can move
+-- the default from one row to another
+ALTER TABLE system_prompts
+    ADD CONSTRAINT system_prompts_one_default_per_category
+    EXCLUDE USING btree (category WITH =) WHERE (is_default)
+    DEFERRABLE INITIALLY DEFERRED;
+
+-- Create set_default_prompt function; returns no rows if the prompt does not
+-- exist. Only admins and the service role may call it
+CREATE OR REPLACE FUNCTION set_default_prompt(p_prompt_id UUID)
+RETURNS SETOF system_prompts
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF auth.role() IS DISTINCT FROM 'service_role'
+       AND NOT EXISTS (SELECT 1 FROM users WHERE id = auth.uid() AND role = 'admin') THEN
+        RAISE EXCEPTION 'set_default_prompt: admin role required'
+            USING ERRCODE = '42501';
+    END IF;
+
+    RETURN QUERY
+    WITH changed AS (
+        UPDATE system_prompts
+        SET is_default = (id = p_prompt_id), updated_at = NOW()
+        WHERE category = (SELECT category FROM system_prompts WHERE id = p_prompt_id)
+          AND (is_default OR id = p_prompt_id)
+        RETURNING *
+    )
+    SELECT * FROM changed WHERE id = p_prompt_id;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION set_default_prompt(UUID) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION set_default_prompt(UUID) TO authenticated, service_role;
+
+-- Create create_system_prompt function; a new default unsets the category's
+-- current default in the same statement. The UPDATE reads the table as it was
+-- before the INSERT, so it never touches the new row
+CREATE OR REPLACE FUNCTION create_system_prompt(
+    p_created_by UUID,
+    p_name TEXT,
+    p_content TEXT,
+    p_category TEXT,
+    p_is_default BOOLEAN DEFAULT FALSE
+)
+RETURNS SETOF system_prompts
+LANGUAGE sql
+AS $$
+    WITH created AS (
+        INSERT INTO system_prompts (created_by, name, content, category, is_default)
+        VALUES (p_created_by, p_name, p_content, p_category, p_is_default)
+        RETURNING *
+    ), unset AS (
+        UPDATE system_prompts
+        SET is_default = FALSE, updated_at = NOW()
+        WHERE p_is_default AND category = p_category AND is_default
+        RETURNING id
+    )
+    SELECT * FROM created;
+$$;
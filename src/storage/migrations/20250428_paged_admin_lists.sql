@@ -0,0 +1,62 @@
+-- Migration: Paged Admin Lists
+-- Description: Returns a page of system prompts or user summaries together with the total row count in one query
+
+-- Create list_system_prompts_paged function
+CREATE OR REPLACE FUNCTION list_system_prompts_paged(
+    category_param TEXT,
+    limit_param INT,
+    offset_param INT
+)
+RETURNS TABLE (
+    id UUID,
+    created_by UUID,
+    name TEXT,
+    content TEXT,
+    category TEXT,
+    is_default BOOLEAN,
+    created_at TIMESTAMP WITH TIME ZONE,
+    updated_at TIMESTAMP WITH TIME ZONE,
+    total BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT p.id, p.created_by, p.name::TEXT, p.content, p.category::TEXT, p.is_default,
+           p.created_at, p.updated_at,
+           COUNT(*) OVER () AS total
+    FROM system_prompts p
+    WHERE category_param IS NULL OR p.category = category_param
+    ORDER BY p.name, p.id
+    LIMIT limit_param OFFSET offset_param;
+$$;
+
+-- Replace get_user_summaries with a version that filters by status and
+-- carries the total, so get_user_count is no longer needed
+DROP FUNCTION IF EXISTS get_user_summaries(INT, INT);
+
+CREATE OR REPLACE FUNCTION get_user_summaries(
+    limit_param INT,
+    offset_param INT,
+    status_param TEXT DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    email TEXT,
+    full_name TEXT,
+    role TEXT,
+    status TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    conversation_count BIGINT,
+    total BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT u.id, u.email::TEXT, u.full_name::TEXT, u.role::TEXT, u.status::TEXT, u.created_at,
+           (SELECT COUNT(*) FROM conversations c WHERE c.user_id = u.id) AS conversation_count,
+           COUNT(*) OVER () AS total
+    FROM users u
+    WHERE status_param IS NULL OR u.status = status_param
+    ORDER BY u.created_at DESC, u.id
+    LIMIT limit_param OFFSET offset_param;
+$$;
@@ -0,0 +1,18 @@
+-- Migration: Delete System Prompt If Unused
+-- Description: Deletes a system prompt only if no conversation references it, checked in the same statement
+
+-- Create delete_system_prompt_if_unused function
+CREATE OR REPLACE FUNCTION delete_system_prompt_if_unused(p_prompt_id UUID)
+RETURNS BOOLEAN
+LANGUAGE sql
+AS $$
+    WITH deleted AS (
+        DELETE FROM system_prompts
+        WHERE id = p_prompt_id
+          AND NOT EXISTS (
+              SELECT 1 FROM conversations WHERE system_prompt_id = p_prompt_id
+          )
+        RETURNING id
+    )
+    SELECT EXISTS (SELECT 1 FROM deleted);
+$$;
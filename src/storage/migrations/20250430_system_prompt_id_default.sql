@@ -0,0 +1,6 @@
+-- Migration: System Prompt ID Default
+-- Description: Lets the database generate system prompt IDs on insert
+
+-- gen_random_uuid() is built in from PostgreSQL 13
+ALTER TABLE system_prompts
+    ALTER COLUMN id SET DEFAULT gen_random_uuid();
@@ -0,0 +1,133 @@
+-- Migration: Conversation Metrics Daily
+-- Description: Pre-aggregates conversation metrics per day and user so dashboard queries read daily buckets instead of scanning conversations and turns
+
+-- One row per day and user; user-level rows keep active user counts exact
+-- across multi-day windows
+CREATE MATERIALIZED VIEW conversation_metrics_daily AS
+SELECT
+    date_trunc('day', c.created_at) AS day,
+    c.user_id,
+    COUNT(*) AS conversations,
+    COALESCE(SUM(t.turns), 0) AS turns,
+    SUM(EXTRACT(EPOCH FROM c.updated_at - c.created_at)) AS duration_seconds
+FROM conversations c
+LEFT JOIN (
+    SELECT conversation_id, COUNT(*) AS turns
+    FROM conversation_turns
+    GROUP BY conversation_id
+) t ON t.conversation_id = c.id
+GROUP BY 1, 2;
+
+-- Unique index required by REFRESH ... CONCURRENTLY; also serves day ranges
+CREATE UNIQUE INDEX conversation_metrics_daily_day_user
+    ON conversation_metrics_daily (day, user_id);
+
+-- The view holds every user's activity; it is read only through
+-- get_conversation_metrics
+REVOKE ALL ON conversation_metrics_daily FROM PUBLIC, anon, authenticated;
+
+-- Time of the last refresh of conversation_metrics_daily
+CREATE TABLE IF NOT EXISTS conversation_metrics_refresh (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    refreshed_at TIMESTAMP WITH TIME ZONE NOT NULL
+);
+
+INSERT INTO conversation_metrics_refresh (refreshed_at)
+VALUES (NOW())
+ON CONFLICT (id) DO NOTHING;
+
+REVOKE ALL ON conversation_metrics_refresh FROM PUBLIC, anon, authenticated;
+
+-- Add function to refresh the daily metrics without blocking readers when the
+-- last refresh is older than max_age; concurrent callers skip the refresh
+-- while another one is running
+CREATE OR REPLACE FUNCTION refresh_conversation_metrics(max_age INTERVAL DEFAULT INTERVAL '0')
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF NOT pg_try_advisory_xact_lock(hashtext('refresh_conversation_metrics')) THEN
+        RETURN;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM conversation_metrics_refresh
+        WHERE refreshed_at > NOW() - max_age
+    ) THEN
+        RETURN;
+    END IF;
+
+    REFRESH MATERIALIZED VIEW CONCURRENTLY conversation_metrics_daily;
+    UPDATE conversation_metrics_refresh SET refreshed_at = NOW();
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION refresh_conversation_metrics(INTERVAL) FROM PUBLIC, anon, authenticated;
+
+-- Create request_conversation_metrics_refresh function; admin clients call it
+-- in the background alongside get_conversation_metrics, so reads never wait
+-- for a refresh. Buckets older than 5 minutes are refreshed
+CREATE OR REPLACE FUNCTION request_conversation_metrics_refresh()
+RETURNS void
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM users WHERE id = auth.uid() AND role = 'admin') THEN
+        RAISE EXCEPTION 'request_conversation_metrics_refresh: admin role required'
+            USING ERRCODE = '42501';
+    END IF;
+
+    PERFORM refresh_conversation_metrics(INTERVAL '5 minutes');
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION request_conversation_metrics_refresh() FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION request_conversation_metrics_refresh() TO authenticated;
+
+-- If pg_cron is available, the daily metrics can also be refreshed on a
+-- schedule, independent of dashboard traffic:
+-- SELECT cron.schedule('*/5 * * * *', 'SELECT refresh_conversation_metrics()');
+
+-- Create get_conversation_metrics function over the daily buckets; the window
+-- is widened to whole days. The buckets are read as of their last refresh,
+-- and only admins may read them
+CREATE OR REPLACE FUNCTION get_conversation_metrics(
+    start_date_param TIMESTAMP WITH TIME ZONE,
+    end_date_param TIMESTAMP WITH TIME ZONE
+)
+RETURNS TABLE (
+    total_conversations BIGINT,
+    active_users BIGINT,
+    total_turns BIGINT,
+    avg_turns_per_conversation FLOAT,
+    avg_conversation_duration FLOAT
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM users WHERE id = auth.uid() AND role = 'admin') THEN
+        RAISE EXCEPTION 'get_conversation_metrics: admin role required'
+            USING ERRCODE = '42501';
+    END IF;
+
+    RETURN QUERY
+    SELECT
+        COALESCE(SUM(m.conversations), 0)::BIGINT,
+        COUNT(DISTINCT m.user_id),
+        COALESCE(SUM(m.turns), 0)::BIGINT,
+        COALESCE(SUM(m.turns)::FLOAT / NULLIF(SUM(m.conversations), 0), 0),
+        COALESCE(SUM(m.duration_seconds)::FLOAT / NULLIF(SUM(m.conversations), 0), 0)
+    FROM conversation_metrics_daily m
+    WHERE m.day >= date_trunc('day', start_date_param)
+      AND m.day <= end_date_param;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION get_conversation_metrics(TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION get_conversation_metrics(TIMESTAMP WITH TIME ZONE, TIMESTAMP WITH TIME ZONE) TO authenticated;
@@ -0,0 +1,42 @@
+-- Migration: Update System Prompt
+-- Description: Updates a system prompt and, when it is the default, unsets the other defaults of its category in one transaction
+
+-- Create update_system_prompt function
+CREATE OR REPLACE FUNCTION update_system_prompt(
+    p_prompt_id UUID,
+    p_name TEXT DEFAULT NULL,
+    p_content TEXT DEFAULT NULL,
+    p_category TEXT DEFAULT NULL,
+    p_is_default BOOLEAN DEFAULT NULL
+)
+RETURNS SETOF system_prompts
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    updated system_prompts;
+BEGIN
+    UPDATE system_prompts
+    SET name = COALESCE(p_name, name),
+        content = COALESCE(p_content, content),
+        category = COALESCE(p_category, category),
+        is_default = COALESCE(p_is_default, is_default),
+        updated_at = NOW()
+    WHERE id = p_prompt_id
+    RETURNING * INTO updated;
+
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- The one-default-per-category constraint is deferred to commit, so the
+    -- old default can be unset after the new one is set. This also covers a
+    -- default prompt moved into a category that has its own default
+    IF updated.is_default THEN
+        UPDATE system_prompts
+        SET is_default = FALSE, updated_at = NOW()
+        WHERE category = updated.category AND is_default AND id <> p_prompt_id;
+    END IF;
+
+    RETURN NEXT updated;
+END;
+$$;
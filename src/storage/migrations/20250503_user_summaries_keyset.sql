@@ -0,0 +1,46 @@
+-- Migration: User Summaries Keyset
+-- Description: Pages user summaries by (created_at, id) position instead of OFFSET, and estimates the user count from table statistics
+
+-- Create composite index matching the list ordering (created_at, id tiebreaker)
+CREATE INDEX IF NOT EXISTS idx_users_created
+ON users(created_at DESC, id DESC);
+
+-- Replace the OFFSET version of get_user_summaries
+DROP FUNCTION IF EXISTS get_user_summaries(INT, INT, TEXT);
+
+CREATE OR REPLACE FUNCTION get_user_summaries(
+    limit_param INT,
+    status_param TEXT DEFAULT NULL,
+    cursor_created_at TIMESTAMP WITH TIME ZONE DEFAULT NULL,
+    cursor_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    email TEXT,
+    full_name TEXT,
+    role TEXT,
+    status TEXT,
+    created_at TIMESTAMP WITH TIME ZONE,
+    conversation_count BIGINT
+)
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT u.id, u.email::TEXT, u.full_name::TEXT, u.role::TEXT, u.status::TEXT, u.created_at,
+           (SELECT COUNT(*) FROM conversations c WHERE c.user_id = u.id) AS conversation_count
+    FROM users u
+    WHERE (status_param IS NULL OR u.status = status_param)
+      AND (cursor_created_at IS NULL OR (u.created_at, u.id) < (cursor_created_at, cursor_id))
+    ORDER BY u.created_at DESC, u.id DESC
+    LIMIT limit_param;
+$$;
+
+-- Create estimate_user_count function; reads planner statistics, so it is
+-- constant time but only as fresh as the last ANALYZE
+CREATE OR REPLACE FUNCTION estimate_user_count()
+RETURNS BIGINT
+LANGUAGE sql
+STABLE
+AS $$
+    SELECT GREATEST(reltuples, 0)::BIGINT FROM pg_class WHERE oid = 'users'::regclass;
+$$;
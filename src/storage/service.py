@@ -120,6 +120,31 @@ class StorageService:
             logger.error(f"Delete audio error: {str(e)}")
             return False
     
+    async def sign_urls(self, paths: List[str], expires_in: int = 3600) -> List[str]:
+        """
+        Create signed URLs for several audio files with a single request.
+        
+        Args:
+            paths: Storage paths of the audio files
+            expires_in: Number of seconds until the URLs expire
+            
+        Returns:
+            Signed URLs in the same order as paths, or an empty list if signing failed
+        """
+        if not paths:
+            return []
+        
+        try:
+            response = self.supabase.storage.from_(
+                self.config["audio_bucket"]
+            ).create_signed_urls(paths, expires_in)
+            
+            return [item["signedURL"] for item in response]
+            
+        except Exception as e:
+            logger.error(f"Sign URLs error: {str(e)}")
+            return []
+    
     async def upload_file(
         self, 
         file_data: Union[bytes, BinaryIO], 
@@ -250,6 +250,40 @@ class TestAdminService:
         assert query_params["filters"][0]["column"] == "category"
         assert query_params["filters"][0]["value"] == category
 
+    @pytest.mark.asyncio
+    async def test_list_system_prompts(self, admin_service, mock_supabase_client):
+        """Test listing system prompts with pagination."""
+        # Arrange
+        # Mock the page query to return one prompt and the exact total
+        mock_response = MagicMock()
+        mock_response.data = [{
+            "id": "prompt-1",
+            "created_by": "admin-user-id",
+            "name": "Prompt 1",
+            "content": "You are a helpful assistant.",
+            "category": "general",
+            "is_default": True,
+            "created_at": "2023-01-01T00:00:00Z",
+            "updated_at": "2023-01-01T00:00:00Z"
+        }]
+        mock_response.count = 25
+        query = mock_supabase_client.table.return_value.select.return_value
+        query.order.return_value.range.return_value.execute.return_value = mock_response
+        
+        # Act
+        result = await admin_service.list_system_prompts(page=2, page_size=10)
+        
+        # Assert
+        assert len(result.items) == 1
+        assert result.items[0].id == "prompt-1"
+        assert result.total == 25
+        assert result.page == 2
+        
+        # Verify the page and the total came from a single request
+        mock_supabase_client.table.return_value.select.assert_called_once_with("*", count="exact")
+        query.order.return_value.range.assert_called_once_with(10, 19)
+        query.order.return_value.range.return_value.execute.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_update_system_prompt(self, admin_service, mock_supabase_table, admin_user):
         """Test updating a system prompt."""
@@ -346,37 +380,14 @@ class TestAdminService:
         mock_supabase_table.delete.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_set_default_system_prompt(self, admin_service, mock_supabase_table, admin_user):
+    async def test_set_default_system_prompt(self, admin_service, mock_supabase_client, mock_supabase_table, admin_user):
         """Test setting a system prompt as default."""
         # Arrange
         prompt_id = "test-prompt-id"
         
-        # Mock the get_all method to return existing prompts
-        mock_supabase_table.get_all.return_value = [
-            {
-                "id": "prompt-1",
-                "created_by": "admin-user-id",
-                "name": "Prompt 1",
-                "content": "You are a helpful assistant.",
-                "category": "General",
-                "is_default": True,
-                "created_at": "2023-01-01T00:00:00Z",
-                "updated_at": "2023-01-01T00:00:00Z"
-            },
-            {
-                "id": prompt_id,
-                "created_by": "admin-user-id",
-                "name": "Test Prompt",
-                "content": "You are a test assistant.",
-                "category": "General",
-                "is_default": False,
-                "created_at": "2023-01-02T00:00:00Z",
-                "updated_at": "2023-01-02T00:00:00Z"
-            }
-        ]
-        
-        # Mock the update method
-        mock_supabase_table.update.return_value = {
+        # Mock the set_default_prompt RPC to return the new default
+        mock_response = MagicMock()
+        mock_response.data = [{
             "id": prompt_id,
             "created_by": "admin-user-id",
             "name": "Test Prompt",
@@ -385,7 +396,8 @@ class TestAdminService:
             "is_default": True,
             "created_at": "2023-01-02T00:00:00Z",
             "updated_at": "2023-01-03T00:00:00Z"
-        }
+        }]
+        mock_supabase_client.rpc.return_value.execute.return_value = mock_response
         
         # Act
         success = await admin_service.set_default_system_prompt(
@@ -396,21 +408,32 @@ class TestAdminService:
         # Assert
         assert success is True
         
-        # Verify Supabase table was called correctly
-        # Should have been called twice - once to unset previous default, once to set new default
-        assert mock_supabase_table.update.call_count == 2
-        
-        # First call should unset the previous default
-        first_call_id = mock_supabase_table.update.call_args_list[0][0][0]
-        first_call_data = mock_supabase_table.update.call_args_list[0][0][1]
-        assert first_call_id == "prompt-1"
-        assert first_call_data["is_default"] is False
-        
-        # Second call should set the new default
-        second_call_id = mock_supabase_table.update.call_args_list[1][0][0]
-        second_call_data = mock_supabase_table.update.call_args_list[1][0][1]
-        assert second_call_id == prompt_id
-        assert second_call_data["is_default"] is True
+        # Verify a single RPC replaced the table scan and both updates
+        mock_supabase_client.rpc.assert_called_once_with(
+            "set_default_prompt", {"p_prompt_id": prompt_id}
+        )
+        mock_supabase_table.get_all.assert_not_called()
+        mock_supabase_table.update.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_default_system_prompt_not_found(self, admin_service, mock_supabase_client, admin_user):
+        """Test setting a missing system prompt as default."""
+        # Arrange
+        prompt_id = "missing-prompt-id"
+        
+        # Mock the set_default_prompt RPC to return no rows
+        mock_response = MagicMock()
+        mock_response.data = []
+        mock_supabase_client.rpc.return_value.execute.return_value = mock_response
+        
+        # Act
+        success = await admin_service.set_default_system_prompt(
+            prompt_id=prompt_id,
+            updated_by=admin_user
+        )
+        
+        # Assert
+        assert success is False
 
     @pytest.mark.asyncio
     async def test_set_default_system_prompt_non_admin(self, admin_service, mock_supabase_table, regular_user):